@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -20,8 +20,8 @@ class BaseProcessor(ABC):
     """Base class for schema processors."""
 
     def __init__(self) -> None:
-        self.required_fields: Set[str] = set()
-        self.optional_fields: Set[str] = set()
+        self.required_fields: AbstractSet[str] = set()
+        self.optional_fields: AbstractSet[str] = set()
 
     @abstractmethod
     def validate(self, data: Dict) -> Tuple[bool, List[str], List[str]]:
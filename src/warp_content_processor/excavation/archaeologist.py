@@ -210,8 +210,9 @@ class ContentArchaeologist:
 
         return artifact
 
+    @staticmethod
     def _calculate_extraction_confidence(
-        self, island, detection_confidence: float
+        island, detection_confidence: float
     ) -> ExtractionConfidence:
         """
         Calculate extraction confidence based on island quality and
@@ -243,7 +244,8 @@ class ContentArchaeologist:
         else:
             return ExtractionConfidence.SUSPECT
 
-    def _map_content_type(self, content_type_str: str) -> ContentType:
+    @staticmethod
+    def _map_content_type(content_type_str: str) -> ContentType:
         """Map string content type to ContentType enum."""
         mapping = {
             "yaml": ContentType.YAML,
@@ -9,7 +9,7 @@ Following DRY: Reuses existing content detection patterns.
 import logging
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
+from typing import AbstractSet, List, Optional, Set, Tuple
 
 from .artifacts import ContaminationType
 
@@ -279,16 +279,12 @@ class SchemaIslandDetector:
         if not content.strip():
             return None
 
-        contamination_types = {
-            cont_type
-            for cont_type, pattern in self.contamination_patterns.items()
-            if pattern.search(content)
-        }
+        contamination_types = self._detect_contamination_types(content)
         # Also check surrounding context for contamination indicators
         if surrounding:
-            for cont_type, pattern in self.contamination_patterns.items():
-                if pattern.search(surrounding) and cont_type not in contamination_types:
-                    contamination_types.add(cont_type)
+            contamination_types |= self._detect_contamination_types(
+                surrounding, skip=contamination_types
+            )
 
         # Clean the content
         cleaned_content, cleaning_warnings = self._clean_content(
@@ -319,6 +315,16 @@ class SchemaIslandDetector:
             surrounding_context=surrounding,
         )
 
+    def _detect_contamination_types(
+        self, text: str, skip: AbstractSet[ContaminationType] = frozenset()
+    ) -> Set[ContaminationType]:
+        """Find contamination types present in text, not searching for skipped ones."""
+        return {
+            cont_type
+            for cont_type, pattern in self.contamination_patterns.items()
+            if cont_type not in skip and pattern.search(text)
+        }
+
     def _clean_content(
         self, content: str, contamination_types: Set[ContaminationType]
     ) -> Tuple[str, List[str]]:
@@ -6,14 +6,18 @@ Handles validation, splitting, and organization of various content types.
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from warp_content_processor.base_processor import ProcessingResult
 
 from .processors.schema_processor import ContentProcessor
 
+# File extensions picked up when processing a directory
+CONTENT_SUFFIXES = (".yaml", ".yml", ".md")
+
 
 def setup_logging() -> None:
     """Configure logging for the application."""
@@ -22,26 +26,51 @@ def setup_logging() -> None:
         format="%(asctime)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler("workflow_processing.log"),
+            # Opened on the first emitted record rather than at setup
+            logging.FileHandler("workflow_processing.log", delay=True),
         ],
     )
 
 
+def iter_content_files(
+    root: Union[str, Path], suffixes: Tuple[str, ...] = CONTENT_SUFFIXES
+) -> Iterator[Path]:
+    """
+    Yield files under root whose names end with one of the given suffixes.
+
+    Walks the tree once with os.scandir, reusing each entry's cached type
+    information instead of running a separate recursive glob per suffix.
+    Symlinked directories are not descended into.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(suffixes) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logging.getLogger(__name__).warning("Cannot scan directory: %s", e)
+
+
 def process_directory(
-    source_dir: Union[str, Path], output_dir: Union[str, Path]
+    source_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    workers: Optional[int] = None,
 ) -> Dict[str, List[ProcessingResult]]:
-    """Process all files in a directory and its subdirectories."""
+    """Process all files in a directory and its subdirectories in parallel."""
     processor = ContentProcessor(output_dir)
     results: Dict[str, List[ProcessingResult]] = {}
 
     # Process all yaml, yml, and md files
-    for ext in ["*.yaml", "*.yml", "*.md"]:
-        for file_path in Path(source_dir).rglob(ext):
-            file_results = processor.process_file(file_path)
-            for result in file_results:
-                if result.content_type not in results:
-                    results[result.content_type] = []
-                results[result.content_type].append(result)
+    file_paths = list(iter_content_files(source_dir))
+    for file_results in processor.process_files(file_paths, workers).values():
+        for result in file_results:
+            if result.content_type not in results:
+                results[result.content_type] = []
+            results[result.content_type].append(result)
 
     return results
 
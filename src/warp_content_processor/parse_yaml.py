@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
 from typing import Any, Dict, List, Tuple, Union
 
 import yaml
 
+# Document start/end markers; without them a stream holds at most one document
+_DOCUMENT_MARKER = re.compile(r"^(?:---|\.\.\.)", re.MULTILINE)
+
 
 def find_yaml_files(start_path: str) -> List[str]:
     """Find all YAML files in the given directory and its subdirectories."""
@@ -77,6 +81,10 @@ def parse_yaml_file(file_path: str) -> List[Dict[str, Any]]:
                     )
                     return []
             except yaml.YAMLError as e:
+                # A stream without document markers is a single document, so
+                # a single-document parse would fail the same way
+                if not _DOCUMENT_MARKER.search(content):
+                    raise
                 # If multi-document parsing fails, try single document
                 try:
                     single_doc = yaml.safe_load(content)
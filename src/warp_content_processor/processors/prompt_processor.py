@@ -21,7 +21,7 @@ class PromptProcessor(SchemaProcessor):
         self.output_dir = output_dir
 
         # Regex patterns
-        self.placeholder_pattern = re.compile(r"{{[a-zA-Z_][a-zA-Z0-9_]*}}")
+        self.placeholder_pattern = re.compile(r"{{([a-zA-Z_][a-zA-Z0-9_]*)}}")
         self.valid_tag_pattern = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
 
     def validate(self, data: Dict) -> Tuple[bool, List[str], List[str]]:
@@ -47,8 +47,9 @@ class PromptProcessor(SchemaProcessor):
 
         # Validate arguments
         if "prompt" in data and "arguments" in data:
-            placeholders = set(self.placeholder_pattern.findall(data["prompt"]))
-            placeholders = {p[2:-2] for p in placeholders}  # Remove {{ and }}
+            placeholders = {
+                m.group(1) for m in self.placeholder_pattern.finditer(data["prompt"])
+            }
 
             if not isinstance(data["arguments"], list):
                 errors.append("'arguments' must be a list")
@@ -2,19 +2,31 @@
 Schema detection and processing for Warp Terminal content types.
 """
 
+import functools
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from ..base_processor import ProcessingResult, SchemaProcessor
 from ..content_type import ContentType
 from ..processor_factory import ProcessorFactory
 
 logger = logging.getLogger(__name__)
 
+# (result, content type, document text) for one validated document
+_AnalyzedDocument = Tuple[ProcessingResult, str, str]
+
 
 # Regular expression patterns for content detection
 CONTENT_PATTERNS = {
@@ -41,6 +53,15 @@ CONTENT_PATTERNS = {
     ],
 }
 
+# Compiled once at import; re's own pattern cache is bounded and is cleared
+# wholesale when it fills up
+_COMPILED_CONTENT_PATTERNS = {
+    ContentType(content_type): [
+        re.compile(pattern, re.MULTILINE | re.IGNORECASE) for pattern in patterns
+    ]
+    for content_type, patterns in CONTENT_PATTERNS.items()
+}
+
 
 class ContentTypeDetector:
     """Detects content type from input."""
@@ -60,13 +81,12 @@ class ContentTypeDetector:
         if not content or content.isspace():
             return ContentType.UNKNOWN
 
-        scores = {ContentType(ctype): 0 for ctype in CONTENT_PATTERNS}
+        scores = dict.fromkeys(_COMPILED_CONTENT_PATTERNS, 0)
 
         # Check each type's patterns
-        for content_type_str, patterns in CONTENT_PATTERNS.items():
-            content_type = ContentType(content_type_str)
+        for content_type, patterns in _COMPILED_CONTENT_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
+                if pattern.search(content):
                     scores[content_type] += 1
 
         # Get type with highest score
@@ -98,7 +118,24 @@ class ContentSplitter:
         Returns:
             List[Tuple[str, str]]: List of (content_type, document_content) pairs
         """
-        documents = []
+        return [
+            (doc_type, doc_content)
+            for doc_type, doc_content, _ in cls._split_documents(content)
+        ]
+
+    @classmethod
+    def _split_documents(
+        cls, content: str
+    ) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+        """
+        Split content into documents, keeping the parsed YAML of each one.
+
+        Returns:
+            List[Tuple[str, str, Optional[Dict[str, Any]]]]: List of
+            (content_type, document_content, parsed_document) triples; the
+            parsed document is None for sections that are not YAML mappings
+        """
+        documents: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
 
         # First try to split by YAML documents with explicit separators
         sections = re.split(r"^---\s*$", content, flags=re.MULTILINE)
@@ -111,18 +148,18 @@ class ContentSplitter:
 
             try:
                 # Try to parse as YAML first
-                doc = yaml.safe_load(section)
+                doc = yaml.load(section, Loader=_SafeLoader)
                 if doc and isinstance(doc, dict):
-                    doc_content = yaml.dump(doc)
+                    doc_content = yaml.dump(doc, Dumper=_SafeDumper)
                     doc_type = ContentTypeDetector.detect_type(doc_content)
-                    documents.append((doc_type, doc_content))
+                    documents.append((doc_type, doc_content, doc))
                     continue
             except yaml.YAMLError:
                 pass
 
             # If not valid YAML, detect type from content patterns
             doc_type = ContentTypeDetector.detect_type(section)
-            documents.append((doc_type, section))
+            documents.append((doc_type, section, None))
 
         return documents
 
@@ -144,6 +181,10 @@ class ContentProcessor:
         for content_type in self.processors.keys():
             (self.output_dir / str(content_type)).mkdir(parents=True, exist_ok=True)
 
+        # Names present in each output directory, scanned once on first write
+        # so collision checks need no stat calls
+        self._existing_names: Dict[Path, Set[str]] = {}
+
     def process_file(self, file_path: Union[str, Path]) -> List[ProcessingResult]:
         """
         Process a single file that may contain multiple content types.
@@ -152,60 +193,174 @@ class ContentProcessor:
             List[ProcessingResult]: Results for each processed document
         """
         try:
-            content = Path(file_path).read_text(encoding="utf-8")
-            documents = ContentSplitter.split_content(content)
-            results = []
+            return self._save_documents(self._analyze_file(file_path))
+        except Exception as e:
+            return self._error_results(file_path, e)
+
+    def process_files(
+        self, file_paths: Iterable[Union[str, Path]], workers: Optional[int] = None
+    ) -> Dict[Path, List[ProcessingResult]]:
+        """
+        Process several files, splitting and validating them in parallel.
+
+        Parsing and validation run in a process pool; output files are
+        written from this process so unique filename selection stays
+        race-free.
 
-            for doc_type_str, doc_content in documents:
+        Args:
+            file_paths: Files to process
+            workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            Dict[Path, List[ProcessingResult]]: Results for each file, in input
+            order
+        """
+        paths = [Path(p) for p in file_paths]
+        if workers == 1 or len(paths) < 2:
+            return {path: self.process_file(path) for path in paths}
+
+        outcomes: Dict[Path, List[ProcessingResult]] = {}
+        # Deferred so importing the package does not load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for path, analysis in zip(
+                paths,
+                executor.map(
+                    functools.partial(
+                        _analyze_content_file, output_dir=self.output_dir
+                    ),
+                    paths,
+                    chunksize=8,
+                ),
+            ):
+                if isinstance(analysis, str):
+                    outcomes[path] = self._error_results(path, analysis)
+                    continue
                 try:
-                    doc_type = ContentType(doc_type_str)
-                    if doc_type in self.processors:
-                        processor = self.processors[doc_type]
-                        result = processor.process(doc_content)
-
-                        if result.is_valid and result.data is not None:
-                            # Generate filename and save
-                            filename = processor.generate_filename(result.data)
-                            output_path = self.output_dir / doc_type / filename
-
-                            # Ensure unique filename
-                            counter = 1
-                            while output_path.exists():
-                                base_name = filename.rsplit(".", 1)[0]
-                                ext = filename.rsplit(".", 1)[1]
-                                output_path = (
-                                    self.output_dir
-                                    / doc_type
-                                    / f"{base_name}_{counter}.{ext}"
-                                )
-                                counter += 1
-
-                            output_path.write_text(doc_content)
-                            logger.info("Saved %s content to %s", doc_type, output_path)
-
-                        results.append(result)
-                except ValueError:
-                    logger.warning("Unknown content type in %s", file_path)
-                    results.append(
+                    outcomes[path] = self._save_documents(analysis)
+                except Exception as e:
+                    outcomes[path] = self._error_results(path, e)
+
+        return outcomes
+
+    def _analyze_file(self, file_path: Union[str, Path]) -> List[_AnalyzedDocument]:
+        """Split and validate a file's documents without writing output."""
+        content = Path(file_path).read_text(encoding="utf-8")
+        documents: List[_AnalyzedDocument] = []
+
+        for doc_type_str, doc_content, doc_data in ContentSplitter._split_documents(
+            content
+        ):
+            try:
+                doc_type = ContentType(doc_type_str)
+            except ValueError:
+                logger.warning("Unknown content type in %s", file_path)
+                documents.append(
+                    (
                         ProcessingResult(
                             content_type=ContentType.UNKNOWN,
                             is_valid=False,
                             data=None,
                             errors=["Unknown content type"],
                             warnings=[],
-                        )
+                        ),
+                        doc_type_str,
+                        doc_content,
                     )
+                )
+                continue
 
-            return results
+            if doc_type not in self.processors:
+                continue
+            processor = self.processors[doc_type]
+            # Reuse the splitter's parse where the processor can validate
+            # already-parsed data
+            validate_data = getattr(processor, "validate_data", None)
+            if doc_data is not None and validate_data is not None:
+                result = validate_data(doc_data)
+            else:
+                result = processor.process(doc_content)
+            documents.append((result, doc_type_str, doc_content))
 
-        except Exception as e:
-            logger.error("Error processing %s: %s", file_path, str(e))
-            return [
-                ProcessingResult(
-                    content_type=ContentType.UNKNOWN,
-                    is_valid=False,
-                    data=None,
-                    errors=[str(e)],
-                    warnings=[],
+        return documents
+
+    def _save_documents(
+        self, documents: List[_AnalyzedDocument]
+    ) -> List[ProcessingResult]:
+        """Write valid analyzed documents and return their results."""
+        results = []
+        for result, doc_type, doc_content in documents:
+            if result.is_valid and result.data is not None:
+                # Generate filename and save
+                processor = self.processors[ContentType(doc_type)]
+                filename = processor.generate_filename(result.data)
+                output_path = self._unique_output_path(
+                    self.output_dir / doc_type, filename
                 )
-            ]
+
+                # One binary write, skipping the text-mode codec layer
+                output_path.write_bytes(doc_content.encode("utf-8"))
+                logger.info("Saved %s content to %s", doc_type, output_path)
+
+            results.append(result)
+        return results
+
+    def _unique_output_path(self, directory: Path, filename: str) -> Path:
+        """Reserve an unused filename in an output directory."""
+        existing = self._existing_names.get(directory)
+        if existing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    existing = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing = set()
+            self._existing_names[directory] = existing
+
+        if filename in existing:
+            base_name, ext = filename.rsplit(".", 1)
+            counter = 1
+            while f"{base_name}_{counter}.{ext}" in existing:
+                counter += 1
+            filename = f"{base_name}_{counter}.{ext}"
+
+        existing.add(filename)
+        return directory / filename
+
+    @staticmethod
+    def _error_results(
+        file_path: Union[str, Path], error: Union[str, Exception]
+    ) -> List[ProcessingResult]:
+        """Build the result list reported for a file that failed outright."""
+        logger.error("Error processing %s: %s", file_path, str(error))
+        return [
+            ProcessingResult(
+                content_type=ContentType.UNKNOWN,
+                is_valid=False,
+                data=None,
+                errors=[str(error)],
+                warnings=[],
+            )
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_content_processor(output_dir: Path) -> ContentProcessor:
+    """Return this worker process's ContentProcessor, built on first use."""
+    return ContentProcessor(output_dir)
+
+
+def _analyze_content_file(
+    file_path: Path, output_dir: Path
+) -> Union[List[_AnalyzedDocument], str]:
+    """
+    Process pool entry point: analyze a file without writing output.
+
+    Returns:
+        Union[List[_AnalyzedDocument], str]: The analyzed documents, or the
+        error message if the file could not be analyzed
+    """
+    try:
+        return _worker_content_processor(output_dir)._analyze_file(file_path)
+    except Exception as e:
+        return str(e)
@@ -2,78 +2,333 @@
 Workflow processor for Warp Terminal workflow files.
 """
 
+import functools
+import hashlib
+import itertools
 import logging
+import mmap
 import os
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 from ..base_processor import ProcessingResult, SchemaProcessor
 from ..content_type import ContentType
 from ..utils.validation import validate_placeholders, validate_tags
 
+__all__ = ["WorkflowProcessor", "WorkflowValidator"]
+
 logger = logging.getLogger(__name__)
 
+# Files larger than this are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 64 * 1024
+
+# Output name used when process_files() bundles workflows into one file
+_BUNDLE_FILENAME = "workflows_bundle.yaml"
+
+# Most platforms cap a single writev() call at 1024 buffers
+_IOV_MAX = 1024
+
+# How written workflows are made durable: fsync every file as it is written,
+# flush everything once when a batch of writes completes, only persist the
+# renamed directory entries once per batch, or leave it all to the OS
+_DURABILITY_MODES = frozenset({"per_file", "batch", "dir", "none"})
+# Modes that defer their flush to sync_output()
+_DEFERRED_DURABILITY = frozenset({"batch", "dir"})
+
+# Serial batches keep this many file reads in flight ahead of the parser
+_READ_AHEAD = 64
+_READ_AHEAD_THREADS = 8
+
+
+# Maps every non-alphanumeric ASCII character to "_" for str.translate
+_ASCII_FILENAME_TABLE = str.maketrans(
+    {chr(c): "_" for c in range(128) if not chr(c).isalnum()}
+)
+
+# Same mapping for arbitrary Unicode: \w is exactly str.isalnum() plus "_"
+_NON_ALNUM = re.compile(r"[\W_]")
+
+
+def _write_all(fd: int, buffers: Sequence[bytes]) -> None:
+    """Write every buffer to ``fd``, coalescing syscalls with writev."""
+    views = [memoryview(buffer) for buffer in buffers if buffer]
+    if not hasattr(os, "writev"):  # pragma: no cover - e.g. Windows
+        for view in views:
+            while view:
+                view = view[os.write(fd, view) :]
+        return
+
+    index = 0
+    while index < len(views):
+        written = os.writev(fd, views[index : index + _IOV_MAX])
+        # Skip fully written buffers and trim a partially written one
+        while written:
+            size = len(views[index])
+            if written < size:
+                views[index] = views[index][written:]
+                break
+            written -= size
+            index += 1
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a written file's data and metadata to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist a directory's entries, such as files renamed into it."""
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - e.g. Windows
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _find_duplicate_inputs(paths: Iterable[Path]) -> Dict[Path, Path]:
+    """Map each file whose bytes repeat an earlier file's to that file."""
+    seen: Dict[bytes, Path] = {}
+    duplicates: Dict[Path, Path] = {}
+    for path in paths:
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, "rb") as handle:
+                for chunk in iter(functools.partial(handle.read, 1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            # Unreadable files are left for processing to report
+            continue
+        original = seen.setdefault(digest.digest(), path)
+        if original != path:
+            duplicates[path] = original
+    return duplicates
+
+
+def _read_small_file(file_path: Path) -> Optional[bytes]:
+    """Read a file for read-ahead, leaving large files to be memory-mapped."""
+    with open(file_path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size > _MMAP_THRESHOLD:
+            return None
+        return handle.read()
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """Clean a workflow name for use as a filename."""
+    lowered = name.lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_FILENAME_TABLE)
+    return _NON_ALNUM.sub("_", lowered)
+
+
+# Schema constants live at module scope so the validation hot path reads
+# them as globals rather than through class or instance attributes
+_REQUIRED_FIELDS = frozenset({"name", "command"})
+_OPTIONAL_FIELDS = frozenset(
+    {
+        "description",
+        "arguments",
+        "tags",
+        "source_url",
+        "author",
+        "author_url",
+        "shells",
+    }
+)
+_KNOWN_FIELDS = _REQUIRED_FIELDS | _OPTIONAL_FIELDS
+_KNOWN_SHELLS = frozenset({"bash", "zsh", "fish", "pwsh", "cmd"})
+_COMMAND_PATTERN = re.compile(r"{{[a-zA-Z_][a-zA-Z0-9_]*}}")
+_VALID_TAG_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
+
+
+def _normalize_arguments(arguments: Any) -> List[Any]:
+    """Return a normalized copy of a workflow's argument list."""
+    # Ensure arguments is a list
+    if not isinstance(arguments, list):
+        logger.warning(
+            "'arguments' field is not a list (got type %s). Discarding its value.",
+            type(arguments).__name__,
+        )
+        return []
+
+    normalized = []
+    for arg in arguments:
+        if isinstance(arg, dict):
+            # Ensure required argument fields without touching the input
+            arg = dict(arg)
+            arg.setdefault("name", "unnamed_arg")
+            arg_type = arg.setdefault("type", "text")
+            if type(arg_type) is str:
+                arg["type"] = arg_type.lower()
+        normalized.append(arg)
+    return normalized
+
+
+# Field handlers share the signature (value, errors, warnings, normalized).
+# ``normalized`` starts as a shallow copy of the workflow, so handlers can
+# read sibling fields from it and replace their own field in place.
+
+
+def _v_name(
+    value: Any, errors: List[str], warnings: List[str], normalized: Dict[str, Any]
+) -> None:
+    """Check that the workflow name is a string."""
+    if not isinstance(value, str):
+        errors.append("Field 'name' must be a string")
+
+
+def _v_command(
+    value: Any, errors: List[str], warnings: List[str], normalized: Dict[str, Any]
+) -> None:
+    """Check that the workflow command is a string."""
+    if not isinstance(value, str):
+        errors.append("Field 'command' must be a string")
+
+
+def _v_shells(
+    value: Any, errors: List[str], warnings: List[str], normalized: Dict[str, Any]
+) -> None:
+    """Validate shell names and lowercase them."""
+    if not isinstance(value, list):
+        errors.append("'shells' must be a list")
+        return
+
+    normalized_shells = [s.lower() if type(s) is str else s for s in value]
+    # Usually every shell is known; only collect the unknown ones otherwise
+    if not _KNOWN_SHELLS.issuperset(normalized_shells):
+        unknown_shells = [
+            orig
+            for orig, norm in zip(value, normalized_shells)
+            if norm not in _KNOWN_SHELLS
+        ]
+        warnings.append(f"Unknown shell types: {unknown_shells}")
+    normalized["shells"] = normalized_shells
+
+
+def _v_arguments(
+    value: Any, errors: List[str], warnings: List[str], normalized: Dict[str, Any]
+) -> None:
+    """Check placeholders against arguments and normalize the arguments."""
+    # Validate command placeholders match arguments
+    command = normalized.get("command")
+    if isinstance(command, str):
+        arg_result = validate_placeholders(command, value)
+        # Placeholder errors are just warnings
+        warnings.extend(arg_result.errors)
+        warnings.extend(arg_result.warnings)
+    normalized["arguments"] = _normalize_arguments(value)
+
+
+def _v_tags(
+    value: Any, errors: List[str], warnings: List[str], normalized: Dict[str, Any]
+) -> None:
+    """Validate tag format and lowercase the tags."""
+    tag_result = validate_tags(value, pattern=_VALID_TAG_PATTERN.pattern)
+    # Tag validation errors are just warnings
+    warnings.extend(tag_result.errors)
+    warnings.extend(tag_result.warnings)
+    if isinstance(value, list):
+        normalized["tags"] = [t.lower() if type(t) is str else t for t in value]
+
+
+# Validation program resolved once at import time: (field, handler) pairs
+# executed in order for every workflow that contains the field
+_HANDLERS = (
+    ("name", _v_name),
+    ("command", _v_command),
+    ("shells", _v_shells),
+    ("arguments", _v_arguments),
+    ("tags", _v_tags),
+)
+
 
 class WorkflowValidator(SchemaProcessor):
     """Validates workflow YAML files against schema requirements."""
 
-    def __init__(self) -> None:
+    REQUIRED_FIELDS: ClassVar[FrozenSet[str]] = _REQUIRED_FIELDS
+    OPTIONAL_FIELDS: ClassVar[FrozenSet[str]] = _OPTIONAL_FIELDS
+    KNOWN_FIELDS: ClassVar[FrozenSet[str]] = _KNOWN_FIELDS
+    KNOWN_SHELLS: ClassVar[FrozenSet[str]] = _KNOWN_SHELLS
+
+    # Regex patterns, compiled once at import time
+    COMMAND_PATTERN: ClassVar[Pattern[str]] = _COMMAND_PATTERN
+    VALID_TAG_PATTERN: ClassVar[Pattern[str]] = _VALID_TAG_PATTERN
+
+    def __init__(
+        self, trust_input: bool = False, max_file_size: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the workflow validator.
+
+        Args:
+            trust_input: Skip schema validation and only normalize workflows.
+                Use only for input produced by a trusted pipeline.
+            max_file_size: Refuse files larger than this many bytes without
+                parsing them (default: no limit)
+        """
         super().__init__()
-        self.required_fields = {"name", "command"}
-        self.optional_fields = {
-            "description",
-            "arguments",
-            "tags",
-            "source_url",
-            "author",
-            "author_url",
-            "shells",
-        }
-        self.known_shells = {"bash", "zsh", "fish", "pwsh", "cmd"}
+        self.trust_input = trust_input
+        self.max_file_size = max_file_size
+        # BaseProcessor sets these per instance; share the class-level sets
+        self.required_fields = self.REQUIRED_FIELDS
+        self.optional_fields = self.OPTIONAL_FIELDS
         self.logger = logging.getLogger(__name__)
 
-        # Regex patterns
-        self.command_pattern = re.compile(r"{{[a-zA-Z_][a-zA-Z0-9_]*}}")
-        self.valid_tag_pattern = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
-
-    def normalize_content(self, data: Dict) -> Dict:
-        """Normalize workflow content to consistent format."""
-        normalized = data.copy()
-
-        # Normalize shells to lowercase
-        if "shells" in normalized:
-            normalized["shells"] = [
-                s.lower() if isinstance(s, str) else s for s in normalized["shells"]
-            ]
-
-        # Normalize tags to lowercase
-        if "tags" in normalized:
-            normalized["tags"] = [
-                t.lower() if isinstance(t, str) else t for t in normalized["tags"]
-            ]
-
-        # Ensure arguments is a list
-        if "arguments" in normalized and not isinstance(normalized["arguments"], list):
-            self.logger.warning(
-                "'arguments' field is not a list (got type %s). Discarding its value.",
-                type(normalized["arguments"]).__name__,
-            )
-            normalized["arguments"] = []
+    def normalize_content(self, data: Dict, mutate: bool = False) -> Dict:
+        """Normalize workflow content to consistent format.
+
+        Args:
+            data: Workflow data to normalize
+            mutate: Normalize ``data`` in place instead of copying it. Only
+                pass True when the caller owns ``data``.
+
+        Returns:
+            Dict: Normalized workflow data
+        """
+        normalized = data if mutate else data.copy()
+
+        # Normalize shells and tags to lowercase; YAML only yields plain str,
+        # so an exact type check is enough and skips the isinstance MRO walk
+        shells = normalized.get("shells")
+        if shells is not None:
+            normalized["shells"] = [s.lower() if type(s) is str else s for s in shells]
+
+        tags = normalized.get("tags")
+        if tags is not None:
+            normalized["tags"] = [t.lower() if type(t) is str else t for t in tags]
 
-        # Normalize argument fields
         if "arguments" in normalized:
-            for arg in normalized["arguments"]:
-                if isinstance(arg, dict):
-                    # Ensure required argument fields
-                    if "name" not in arg:
-                        arg["name"] = "unnamed_arg"
-                    if "type" not in arg:
-                        arg["type"] = "text"
-                    # Convert type to lowercase
-                    arg["type"] = arg["type"].lower()
+            normalized["arguments"] = _normalize_arguments(normalized["arguments"])
 
         return normalized
 
@@ -88,126 +343,121 @@ class WorkflowValidator(SchemaProcessor):
                 bool: Whether the data is valid
                 List[str]: Error messages
                 List[str]: Warning messages
-                Optional[Dict[str, Any]]: Normalized data if valid, None otherwise
         """
-        errors: List[str] = []
-        warnings: List[str] = []
+        is_valid, errors, warnings, _ = self._validate_and_normalize(data)
+        return is_valid, errors, warnings
+
+    def _validate_and_normalize(
+        self, data: Dict[str, Any], mutate: bool = False
+    ) -> Tuple[bool, List[str], List[str], Optional[Dict[str, Any]]]:
+        """Validate and normalize workflow data in a single pass.
 
-        # Make a copy for normalization
-        normalized_data = data.copy()
+        Args:
+            data: Dictionary of workflow data to validate
+            mutate: Normalize ``data`` in place instead of copying it. Only
+                pass True when the caller owns ``data``.
 
+        Returns:
+            Tuple containing:
+                bool: Whether the data is valid
+                List[str]: Error messages
+                List[str]: Warning messages
+                Optional[Dict[str, Any]]: Normalized data if valid, None otherwise
+        """
         # Check for empty data
-        if not normalized_data:
-            errors.append("Empty or invalid workflow data")
-            return False, errors, warnings
-
-        # Check required fields
-        missing_fields = self.required_fields - set(normalized_data.keys())
-        if missing_fields:
-            errors.append(f"Missing required fields: {missing_fields}")
-
-        # Validate types
-        if "name" in data and not isinstance(data["name"], str):
-            errors.append("Field 'name' must be a string")
-        if "command" in data and not isinstance(data["command"], str):
-            errors.append("Field 'command' must be a string")
-
-        # Check for unknown fields
-        unknown_fields = (
-            set(normalized_data.keys()) - self.required_fields - self.optional_fields
-        )
-        if unknown_fields:
-            warnings.append(f"Unknown fields present: {unknown_fields}")
+        if not data:
+            return False, ["Empty or invalid workflow data"], [], None
 
-        # Validate shells
-        if "shells" in data:
-            if not isinstance(data["shells"], list):
-                errors.append("'shells' must be a list")
-            else:
-                # Make a copy of shells for normalization
-                shells = data["shells"].copy()
-                normalized_shells = [
-                    s.lower() if isinstance(s, str) else s for s in shells
-                ]
-                unknown_shells = [
-                    orig
-                    for orig, norm in zip(shells, normalized_shells)
-                    if norm not in self.known_shells
-                ]
-                if unknown_shells:
-                    warnings.append(f"Unknown shell types: {unknown_shells}")
-                # Update shells to normalized versions
-                data["shells"] = normalized_shells
-
-        # Validate command placeholders match arguments
-        if (
-            "command" in data
-            and isinstance(data["command"], str)
-            and "arguments" in data
-        ):
-            arg_errors, arg_warnings = validate_placeholders(
-                data["command"], data.get("arguments", [])
-            )
-            # Placeholder errors are just warnings
-            warnings.extend(arg_errors)
-            warnings.extend(arg_warnings)
-
-        # Validate tags
-        if "tags" in data:
-            tag_errors, tag_warnings = validate_tags(
-                data.get("tags", []), pattern=self.valid_tag_pattern.pattern
-            )
-            # Tag validation errors are just warnings
-            warnings.extend(tag_errors)
-            warnings.extend(tag_warnings)
+        # Allocated only once there is something to validate; the handlers
+        # fill these, and validate_data() hands them to the result as-is
+        errors: List[str] = []
+        warnings: List[str] = []
+        normalized = data if mutate else data.copy()
+
+        # Check required and unknown fields; the subset tests allocate
+        # nothing, so difference sets are only built for the message
+        keys = data.keys()
+        if not keys >= _REQUIRED_FIELDS:
+            errors.append(f"Missing required fields: {_REQUIRED_FIELDS - keys}")
+        if not _KNOWN_FIELDS.issuperset(keys):
+            warnings.append(f"Unknown fields present: {keys - _KNOWN_FIELDS}")
 
-        # Only return normalized data if validation passed
-        # Store normalized data for later use if validation passes
-        self._last_normalized_data = normalized_data if len(errors) == 0 else None
+        # Run the per-field validation program
+        for field, handler in _HANDLERS:
+            if field in data:
+                handler(data[field], errors, warnings, normalized)
 
-        return len(errors) == 0, errors, warnings
+        is_valid = not errors
+        return is_valid, errors, warnings, normalized if is_valid else None
 
     def process(self, content: str) -> ProcessingResult:
         """Process and validate workflow content."""
-        errors: List[str] = []
-        warnings: List[str] = []
-        data = None
-
         # Early returns for invalid content
         if not content:
-            errors.append("Empty content provided")
+            error = "Empty content provided"
         elif content.isspace():
-            errors.append("Content contains only whitespace")
+            error = "Content contains only whitespace"
         else:
             try:
-                data = yaml.safe_load(content)
-                # Handle None (empty YAML) and empty structures
-                if data is None or (isinstance(data, (dict, list)) and not data):
-                    errors.append(
-                        "Empty YAML content (document contains no actual data)"
-                    )
-                elif not isinstance(data, dict):
-                    errors.append("Content must be a YAML dictionary")
-                else:
-                    # Validate content
-                    is_valid, val_errors, val_warnings = self.validate(data)
-                    normalized_data = self._last_normalized_data
-                    if is_valid:
-                        return ProcessingResult(
-                            content_type=ContentType.WORKFLOW,
-                            is_valid=True,
-                            data=normalized_data,
-                            errors=[],
-                            warnings=val_warnings,
-                        )
-                    errors.extend(val_errors)
-                    warnings.extend(val_warnings)
+                data = yaml.load(content, Loader=_SafeLoader)
             except yaml.YAMLError as e:
-                errors.append(f"Invalid YAML syntax: {str(e)}")
-            except Exception as e:
-                errors.append(f"Error processing workflow: {str(e)}")
+                error = f"Invalid YAML syntax: {str(e)}"
+            else:
+                return self.validate_data(data)
+
+        return ProcessingResult(
+            content_type=ContentType.WORKFLOW,
+            is_valid=False,
+            data=None,
+            errors=[error],
+            warnings=[],
+        )
+
+    def validate_data(self, data: Any) -> ProcessingResult:
+        """Validate an already-parsed workflow document.
+
+        Args:
+            data: Parsed YAML document for a single workflow; it is
+                normalized in place
+
+        Returns:
+            ProcessingResult: Validation status with normalized data if valid
+        """
+        # Message lists are only allocated by the branch that fills them
+        try:
+            # Handle None (empty YAML) and empty structures
+            if data is None or (isinstance(data, (dict, list)) and not data):
+                errors = ["Empty YAML content (document contains no actual data)"]
+                warnings: List[str] = []
+            elif not isinstance(data, dict):
+                errors = ["Content must be a YAML dictionary"]
+                warnings = []
+            elif self.trust_input:
+                # Trusted input skips validation entirely
+                return ProcessingResult(
+                    content_type=ContentType.WORKFLOW,
+                    is_valid=True,
+                    data=self.normalize_content(data, mutate=True),
+                    errors=[],
+                    warnings=[],
+                )
+            else:
+                is_valid, errors, warnings, normalized = self._validate_and_normalize(
+                    data, mutate=True
+                )
+                if is_valid:
+                    # ``errors`` is empty here; reuse it instead of a new list
+                    return ProcessingResult(
+                        content_type=ContentType.WORKFLOW,
+                        is_valid=True,
+                        data=normalized,
+                        errors=errors,
+                        warnings=warnings,
+                    )
+        except Exception as e:
+            errors = [f"Error processing workflow: {str(e)}"]
+            warnings = []
 
-        # Return error result if we get here
         return ProcessingResult(
             content_type=ContentType.WORKFLOW,
             is_valid=False,
@@ -216,26 +466,128 @@ class WorkflowValidator(SchemaProcessor):
             warnings=warnings,
         )
 
+    def validate_file(self, file_path: Path) -> Optional[List[ProcessingResult]]:
+        """
+        Parse and validate every workflow in a file.
+
+        Each YAML document in the file may hold a single workflow or a list
+        of workflows; documents are streamed and validated one at a time.
+
+        Args:
+            file_path: YAML file containing one or more workflow documents
+
+        Returns:
+            Optional[List[ProcessingResult]]: One result per workflow, or None
+            if the file does not contain any workflows
+
+        Raises:
+            ValueError: If the file is larger than max_file_size
+        """
+        with open(file_path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if not self._accept_size(size):
+                return None
+            # Let libyaml read large files straight from the page cache
+            if size > _MMAP_THRESHOLD:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._validate_documents(
+                        yaml.load_all(mapped, Loader=_SafeLoader)
+                    )
+            return self._validate_documents(
+                yaml.load_all(handle.read(), Loader=_SafeLoader)
+            )
+
+    def _accept_size(self, size: int) -> bool:
+        """Return whether a file of this size needs parsing at all."""
+        if self.max_file_size is not None and size > self.max_file_size:
+            raise ValueError(
+                f"File size {size} exceeds limit of {self.max_file_size} bytes"
+            )
+        # Empty files hold no workflows
+        return size > 0
+
+    def _validate_documents(
+        self, documents: Iterable[Any]
+    ) -> Optional[List[ProcessingResult]]:
+        """Validate the workflows held by a stream of parsed YAML documents."""
+        results: List[ProcessingResult] = []
+        found_workflows = False
+        for document in documents:
+            if isinstance(document, dict):
+                document = [document]
+            elif not isinstance(document, list):
+                continue
+
+            found_workflows = True
+            # Validate the parsed workflows directly; no re-serialization
+            results.extend(self.validate_data(workflow) for workflow in document)
+
+        return results if found_workflows else None
+
     def generate_filename(self, data: Dict) -> str:
         """Generate filename for workflow content."""
         name = data.get("name", "unnamed_workflow")
-        # Clean name for use as filename
-        clean_name = "".join(c if c.isalnum() else "_" for c in name.lower())
-        return f"{clean_name}.yaml"
+        return f"{_clean_name(name)}.yaml"
 
 
 class WorkflowProcessor(WorkflowValidator):
     """Main class for processing workflow files."""
 
-    def __init__(self, output_dir: Path) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        output_dir: Path,
+        dedupe_output: bool = False,
+        trust_input: bool = False,
+        durability: str = "per_file",
+        max_file_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the workflow processor.
+
+        Args:
+            output_dir: Directory that receives processed workflow files
+            dedupe_output: Skip writing a workflow when identical content was
+                already written under the same name by this processor
+            trust_input: Skip schema validation and only normalize workflows.
+                Use only for input produced by a trusted pipeline.
+            durability: "per_file" fsyncs each output file before it is
+                renamed into place. "batch" skips those fsyncs and instead
+                fsyncs each file written in the batch, then the output
+                directory, when process_files() finishes or sync_output()
+                is called. "dir"
+                only fsyncs the output directory at those points, making the
+                atomic renames durable without flushing file data. "none"
+                never fsyncs.
+            max_file_size: Refuse files larger than this many bytes without
+                parsing them (default: no limit)
+
+        Raises:
+            ValueError: If durability is not a known mode
+        """
+        if durability not in _DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability!r}")
+        super().__init__(trust_input=trust_input, max_file_size=max_file_size)
         self.output_dir = Path(output_dir)
+        self.dedupe_output = dedupe_output
+        self.durability = durability
+        # Set when deferred durability has writes that are not yet flushed
+        self._sync_pending = False
+        # Files written in "batch" mode whose data is not yet flushed
+        self._unsynced_paths: Set[Path] = set()
         self.processed_files: List[Tuple[Path, Path]] = []
         self.failed_files: List[Tuple[Path, str]] = []
         self.warnings: List[Tuple[Path, str]] = []
-        self._last_normalized_data: Optional[Dict[str, Any]] = None
+        # (generated filename, content digest) -> path already written
+        self._written: Dict[Tuple[str, bytes], Path] = {}
+
+        # Pending bundle documents while process_files(bundle_output=True) runs
+        self._bundle: Optional[List[Dict[str, Any]]] = None
+        self._bundle_path: Optional[Path] = None
 
         os.makedirs(self.output_dir, exist_ok=True)
+        # Snapshot existing names once so collision checks need no stat calls
+        with os.scandir(self.output_dir) as entries:
+            self._existing_names: Set[str] = {entry.name for entry in entries}
 
     def process_file(self, file_path: Path) -> bool:
         """
@@ -245,57 +597,299 @@ class WorkflowProcessor(WorkflowValidator):
             bool: True if processing was successful
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            workflows = yaml.safe_load(content)
-
-            if not isinstance(workflows, (dict, list)):
-                logger.warning(f"No valid workflows found in {file_path}")
-                self.failed_files.append((file_path, "No valid workflows found"))
-                return False
-
-            if isinstance(workflows, dict):
-                workflows = [workflows]
-
-            success = True
-            for workflow in workflows:
-                # Validate workflow
-                result = self.process(yaml.dump(workflow))
-
-                if not result.is_valid:
-                    logger.error(
-                        f"Validation failed for workflow in {file_path}: "
-                        f"{result.errors}"
-                    )
-                    self.failed_files.append((file_path, result.errors[0]))
-                    success = False
-                    continue
+            results = self.validate_file(file_path)
+            return self._save_results(file_path, results)
 
-                # Log any warnings
-                for warning in result.warnings:
-                    logger.warning(f"Warning for {file_path}: {warning}")
-                    self.warnings.append((file_path, warning))
+        except Exception as e:
+            self.logger.error("Error processing %s: %s", file_path, str(e))
+            self.failed_files.append((file_path, str(e)))
+            return False
 
-                    # Generate output filename and save
-                    if result.data is not None:
-                        filename = self.generate_filename(result.data)
-                        output_path = self.output_dir / filename
-                    else:
-                        continue
+    def process_files(
+        self,
+        file_paths: Iterable[Path],
+        workers: Optional[int] = None,
+        bundle_output: bool = False,
+        skip_duplicate_inputs: bool = False,
+    ) -> Dict[Path, bool]:
+        """
+        Process several workflow files, validating them in parallel.
 
-                # Ensure unique filename
-                counter = 1
-                while output_path.exists():
-                    base_name = filename.rsplit(".", 1)[0]
-                    output_path = self.output_dir / f"{base_name}_{counter}.yaml"
-                    counter += 1
+        Parsing and validation run in a process pool; output files are
+        written from this process so unique filename selection stays
+        race-free.
 
-                output_path.write_text(yaml.dump(result.data), encoding="utf-8")
-                logger.info(f"Created workflow file: {output_path}")
-                self.processed_files.append((file_path, output_path))
+        Args:
+            file_paths: Workflow files to process
+            workers: Maximum number of worker processes (default: CPU count);
+                with 1, files are validated in this process while upcoming
+                files are read ahead on background threads
+            bundle_output: Write all valid workflows as documents of a single
+                multi-document YAML file, serialized in one pass and written once,
+                instead of one file per workflow
+            skip_duplicate_inputs: Hash each file's bytes up front and only
+                process the first of any byte-identical files; the others
+                share its outcome
 
-            return success
+        Returns:
+            Dict[Path, bool]: Processing success for each file
+        """
+        paths = [Path(p) for p in file_paths]
+        duplicates: Dict[Path, Path] = {}
+        if skip_duplicate_inputs:
+            duplicates = _find_duplicate_inputs(paths)
+        if bundle_output:
+            self._bundle = []
+            self._bundle_path = self._unique_output_path(_BUNDLE_FILENAME)
 
-        except Exception as e:
-            self.logger.error("Error processing %s: %s", file_path, str(e))
-            self.failed_files.append((file_path, str(e)))
+        try:
+            outcomes = self._process_paths(
+                [path for path in paths if path not in duplicates], workers
+            )
+            if self._bundle and self._bundle_path is not None:
+                # One dumper and emitter serialize every bundled document
+                payload = yaml.dump_all(
+                    self._bundle,
+                    Dumper=_SafeDumper,
+                    encoding="utf-8",
+                    explicit_start=True,
+                )
+                try:
+                    self._write_output(self._bundle_path, payload)
+                except OSError as e:
+                    self._fail_bundle(self._bundle_path, str(e), outcomes)
+                else:
+                    logger.info(f"Created workflow bundle: {self._bundle_path}")
+        finally:
+            self._bundle = None
+        self.sync_output()
+
+        if duplicates:
+            for path, original in duplicates.items():
+                logger.info(f"Skipped duplicate input {path} (same as {original})")
+            outcomes = {path: outcomes[duplicates.get(path, path)] for path in paths}
+
+        return outcomes
+
+    def _fail_bundle(
+        self, bundle_path: Path, error: str, outcomes: Dict[Path, bool]
+    ) -> None:
+        """Record every file bundled into an unwritten bundle as failed."""
+        self.logger.error("Error writing bundle %s: %s", bundle_path, error)
+        bundled = [entry for entry in self.processed_files if entry[1] == bundle_path]
+        self.processed_files = [
+            entry for entry in self.processed_files if entry[1] != bundle_path
+        ]
+        for file_path in dict.fromkeys(path for path, _ in bundled):
+            self.failed_files.append((file_path, error))
+            outcomes[file_path] = False
+
+    def _process_paths(
+        self, paths: List[Path], workers: Optional[int]
+    ) -> Dict[Path, bool]:
+        """Validate files, in a process pool when worthwhile, and save results."""
+        if len(paths) < 2:
+            return {path: self.process_file(path) for path in paths}
+        if workers == 1:
+            return self._process_paths_serially(paths)
+
+        outcomes: Dict[Path, bool] = {}
+        # Imported here: multiprocessing is only needed once a pool is used,
+        # which keeps it off the package import path
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for path, (results, error) in zip(
+                paths,
+                executor.map(
+                    functools.partial(
+                        _validate_workflow_file,
+                        trust_input=self.trust_input,
+                        max_file_size=self.max_file_size,
+                    ),
+                    paths,
+                    chunksize=8,
+                ),
+            ):
+                if error is not None:
+                    self.logger.error("Error processing %s: %s", path, error)
+                    self.failed_files.append((path, error))
+                    outcomes[path] = False
+                    continue
+                try:
+                    outcomes[path] = self._save_results(path, results)
+                except Exception as e:
+                    self.logger.error("Error processing %s: %s", path, str(e))
+                    self.failed_files.append((path, str(e)))
+                    outcomes[path] = False
+
+        return outcomes
+
+    def _process_paths_serially(self, paths: List[Path]) -> Dict[Path, bool]:
+        """Validate and save files in order, reading ahead on a thread pool."""
+        outcomes: Dict[Path, bool] = {}
+        remaining = iter(paths)
+        with ThreadPoolExecutor(max_workers=_READ_AHEAD_THREADS) as reader:
+            pending: "deque[Tuple[Path, Future[Optional[bytes]]]]" = deque(
+                (path, reader.submit(_read_small_file, path))
+                for path in itertools.islice(remaining, _READ_AHEAD)
+            )
+            while pending:
+                path, read = pending.popleft()
+                for next_path in itertools.islice(remaining, 1):
+                    pending.append(
+                        (next_path, reader.submit(_read_small_file, next_path))
+                    )
+                try:
+                    data = read.result()
+                    if data is None:
+                        results = self.validate_file(path)
+                    elif self._accept_size(len(data)):
+                        results = self._validate_documents(
+                            yaml.load_all(data, Loader=_SafeLoader)
+                        )
+                    else:
+                        results = None
+                    outcomes[path] = self._save_results(path, results)
+                except Exception as e:
+                    self.logger.error("Error processing %s: %s", path, str(e))
+                    self.failed_files.append((path, str(e)))
+                    outcomes[path] = False
+
+        return outcomes
+
+    def _save_results(
+        self, file_path: Path, results: Optional[List[ProcessingResult]]
+    ) -> bool:
+        """Record validation results for a file and write valid workflows."""
+        if results is None:
+            logger.warning(f"No valid workflows found in {file_path}")
+            self.failed_files.append((file_path, "No valid workflows found"))
             return False
+
+        # Bind hot attributes to locals once for the per-workflow loop
+        failed_append = self.failed_files.append
+        warn_append = self.warnings.append
+        ok_append = self.processed_files.append
+        log_warn = logger.warning
+        log_err = logger.error
+        dump = yaml.dump
+        write_workflow = self._write_workflow
+        bundle = self._bundle
+        bundle_path = self._bundle_path
+
+        success = True
+        for result in results:
+            if not result.is_valid:
+                log_err(
+                    f"Validation failed for workflow in {file_path}: "
+                    f"{result.errors}"
+                )
+                failed_append((file_path, result.errors[0]))
+                success = False
+                continue
+
+            # Log any warnings
+            for warning in result.warnings:
+                log_warn(f"Warning for {file_path}: {warning}")
+                warn_append((file_path, warning))
+
+            if result.data is None:
+                continue
+
+            if bundle is not None and bundle_path is not None:
+                # Defer serialization; the bundle is dumped once per batch
+                bundle.append(result.data)
+                output_path = bundle_path
+            else:
+                payload = dump(result.data, Dumper=_SafeDumper, encoding="utf-8")
+                output_path = write_workflow(result.data, payload)
+            ok_append((file_path, output_path))
+
+        return success
+
+    def _write_workflow(self, data: Dict[str, Any], payload: bytes) -> Path:
+        """Write a serialized workflow to a unique output file."""
+        filename = self.generate_filename(data)
+        if self.dedupe_output:
+            key = (filename, hashlib.blake2b(payload, digest_size=16).digest())
+            existing_path = self._written.get(key)
+            if existing_path is not None:
+                logger.info(f"Skipped identical workflow: {existing_path}")
+                return existing_path
+
+        # Generate output filename and save
+        output_path = self._unique_output_path(filename)
+        self._write_output(output_path, payload)
+        logger.info(f"Created workflow file: {output_path}")
+        if self.dedupe_output:
+            self._written[key] = output_path
+        return output_path
+
+    def _unique_output_path(self, filename: str) -> Path:
+        """Reserve an unused filename in the output directory."""
+        existing = self._existing_names
+        if filename in existing:
+            base_name = filename.rsplit(".", 1)[0]
+            counter = 1
+            while f"{base_name}_{counter}.yaml" in existing:
+                counter += 1
+            filename = f"{base_name}_{counter}.yaml"
+
+        existing.add(filename)
+        return self.output_dir / filename
+
+    def sync_output(self) -> None:
+        """
+        Make workflows written in a deferred durability mode durable.
+
+        In "batch" mode, fsyncs each file written since the last sync.
+        In both "batch" and "dir" modes, then fsyncs the output directory so
+        the renamed entries persist. Does nothing when no deferred writes
+        are pending.
+        """
+        if not self._sync_pending:
+            return
+        for path in self._unsynced_paths:
+            _fsync_file(path)
+        self._unsynced_paths.clear()
+        _fsync_directory(self.output_dir)
+        self._sync_pending = False
+
+    def _write_output(self, path: Path, *buffers: bytes) -> None:
+        """Atomically write an output file according to the durability mode."""
+        durability = self.durability
+        self._atomic_write(path, *buffers, fsync=durability == "per_file")
+        if durability in _DEFERRED_DURABILITY:
+            self._sync_pending = True
+            if durability == "batch":
+                self._unsynced_paths.add(path)
+
+    @staticmethod
+    def _atomic_write(path: Path, *buffers: bytes, fsync: bool = True) -> None:
+        """Write buffers to a temporary file and atomically move it into place."""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_all(fd, buffers)
+            if fsync:
+                os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+
+
+def _validate_workflow_file(
+    file_path: Path, trust_input: bool = False, max_file_size: Optional[int] = None
+) -> Tuple[Optional[List[ProcessingResult]], Optional[str]]:
+    """Process pool entry point: validate a file without writing output."""
+    try:
+        validator = WorkflowValidator(
+            trust_input=trust_input, max_file_size=max_file_size
+        )
+        return validator.validate_file(file_path), None
+    except Exception as e:
+        return None, str(e)
@@ -1,9 +1,22 @@
 """Shared validation utilities for content processors."""
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Pattern, Set, Tuple, Union
 
+_DEFAULT_TAG_PATTERN = r"^[a-z0-9][a-z0-9-]*[a-z0-9]$"
+_TAG_BODY = r"[a-z0-9][a-z0-9-]*[a-z0-9]"
+
+# Matches a newline-joined batch of tags that all satisfy the default pattern,
+# letting the common all-valid case be confirmed in a single C-level scan
+_VALID_TAG_BATCH = re.compile(rf"{_TAG_BODY}(?:\n{_TAG_BODY})*")
+_INVALID_TAG_CHARS = re.compile(r"[^a-z0-9-]")
+
+# Caller-supplied patterns are compiled once and reused across calls rather
+# than going through re's bounded, non-LRU module cache
+_compile_pattern = functools.lru_cache(maxsize=64)(re.compile)
+
 
 @dataclass
 class ValidationResult:
@@ -25,7 +38,9 @@ class ValidationResult:
 
 
 def validate_placeholders(
-    content: str, arguments: List[Dict], pattern: str = r"{{[a-zA-Z_][a-zA-Z0-9_]*}}"
+    content: str,
+    arguments: List[Dict],
+    pattern: str = r"{{([a-zA-Z_][a-zA-Z0-9_]*)}}",
 ) -> ValidationResult:
     """
     Validate command/prompt placeholders against provided arguments.
@@ -33,7 +48,8 @@ def validate_placeholders(
     Args:
         content: String containing placeholders
         arguments: List of argument dictionaries
-        pattern: Regex pattern for placeholders (default: {{name}})
+        pattern: Regex pattern for placeholders (default: {{name}}); if it
+            has a capturing group, the first group is the placeholder name
 
     Returns:
         Tuple[List[str], List[str]]: (errors, warnings)
@@ -45,9 +61,12 @@ def validate_placeholders(
         return ValidationResult(is_valid=False, errors=["'arguments' must be a list"])
 
     # Validate placeholders
-    placeholder_pattern = re.compile(pattern)
-    placeholders = set(placeholder_pattern.findall(content))
-    placeholders = {p[2:-2] for p in placeholders}  # Remove {{ and }}
+    placeholder_pattern = _compile_pattern(pattern)
+    if placeholder_pattern.groups:
+        placeholders = {m.group(1) for m in placeholder_pattern.finditer(content)}
+    else:
+        # Remove {{ and }}
+        placeholders = {m.group()[2:-2] for m in placeholder_pattern.finditer(content)}
 
     # Extract argument names, handling invalid types
     valid_args = [arg for arg in arguments if isinstance(arg, dict)]
@@ -71,8 +90,25 @@ def validate_placeholders(
     return ValidationResult(is_valid=True, warnings=warnings)
 
 
+def _all_tags_valid(tags: List[str]) -> bool:
+    """
+    Check in one scan whether every tag is a string matching the default pattern.
+
+    The separator count guards against tags that themselves contain newlines.
+    """
+    if not tags:
+        return False
+    try:
+        joined = "\n".join(tags)
+    except TypeError:
+        return False
+    return joined.count("\n") == len(tags) - 1 and bool(
+        _VALID_TAG_BATCH.fullmatch(joined)
+    )
+
+
 def validate_tags(
-    tags: List[str], pattern: str = r"^[a-z0-9][a-z0-9-]*[a-z0-9]$"
+    tags: List[str], pattern: str = _DEFAULT_TAG_PATTERN
 ) -> ValidationResult:
     """
     Validate tag format.
@@ -87,9 +123,12 @@ def validate_tags(
     if not isinstance(tags, list):
         return ValidationResult(is_valid=False, errors=["'tags' must be a list"])
 
+    if pattern == _DEFAULT_TAG_PATTERN and _all_tags_valid(tags):
+        return ValidationResult(is_valid=True)
+
     warnings = []
-    tag_pattern = re.compile(pattern)
-    invalid_tag_chars = re.compile(r"[^a-z0-9-]")
+    match_tag = _compile_pattern(pattern).match
+    search_invalid_chars = _INVALID_TAG_CHARS.search
 
     for tag in tags:
         if not isinstance(tag, str):
@@ -101,9 +140,9 @@ def validate_tags(
             warnings.append("Empty tag found")
             continue
 
-        if not tag_pattern.match(tag_str):
+        if not match_tag(tag_str):
             # Provide specific warning about the issue
-            if invalid_tag_chars.search(tag_str):
+            if search_invalid_chars(tag_str):
                 warnings.append(f"Tag '{tag_str}' contains invalid characters")
             elif tag_str.isupper():
                 warnings.append(f"Tag '{tag_str}' should be lowercase")
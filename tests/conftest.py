@@ -5,6 +5,7 @@ This module provides common test fixtures, configurations, and utilities
 that are shared across all test modules in the test suite.
 """
 
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -133,20 +134,16 @@ def mock_logger():
 
 
 @pytest.fixture
-def environment_variables() -> Generator[Dict[str, str], None, None]:
+def environment_variables(monkeypatch: pytest.MonkeyPatch) -> Dict[str, str]:
     """Manage environment variables for testing."""
-    original_env = os.environ.copy()
     test_env = {"TEST_MODE": "true", "LOG_LEVEL": "DEBUG", "PYTEST_RUNNING": "true"}
 
-    # Set test environment variables
+    # Set test environment variables; monkeypatch restores just these keys
+    # instead of copying and rebuilding the whole environment every test
     for key, value in test_env.items():
-        os.environ[key] = value
+        monkeypatch.setenv(key, value)
 
-    yield test_env
-
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    return test_env
 
 
 @pytest.fixture
@@ -242,12 +239,31 @@ def processor_test_config() -> Dict[str, Any]:
     }
 
 
+# Where pytest_runtest_logreport streams results (--progress-report)
+_progress_report_path = None
+
 # Test markers for different test categories
 pytestmark = [
     pytest.mark.filterwarnings("ignore::DeprecationWarning"),
 ]
 
 
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--progress-report",
+        metavar="PATH",
+        default=None,
+        help="append one JSON line per finished test to PATH as results arrive",
+    )
+    parser.addoption(
+        "--skip-cache-tracking",
+        action="store_true",
+        default=False,
+        help="do not record last-failed/new-first state for this run",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom settings."""
     config.addinivalue_line("markers", "smoke: mark test as a smoke test")
@@ -257,6 +273,27 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "security: mark test as security related")
     config.addinivalue_line("markers", "performance: mark test as performance related")
 
+    # xdist workers forward their reports to the controller, which is then the
+    # only process writing the progress report
+    global _progress_report_path
+    path = config.getoption("--progress-report")
+    if path and not hasattr(config, "workerinput"):
+        _progress_report_path = os.path.abspath(path)
+        # Start each session from an empty report
+        open(_progress_report_path, "w").close()
+
+    # Opt-in skip of the last-failed/new-first bookkeeping; a run that reads
+    # that state with --lf/--ff/--nf keeps it
+    if config.getoption("--skip-cache-tracking") and not (
+        config.getoption("lf", False)
+        or config.getoption("failedfirst", False)
+        or config.getoption("newfirst", False)
+    ):
+        for name in ("lfplugin", "nfplugin"):
+            plugin = config.pluginmanager.get_plugin(name)
+            if plugin is not None:
+                config.pluginmanager.unregister(plugin)
+
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test location."""
@@ -275,3 +312,25 @@ def pytest_collection_modifyitems(config, items):
         # Add security marker to security tests
         if "security" in item.nodeid.lower() or "validation" in item.nodeid.lower():
             item.add_marker(pytest.mark.security)
+
+
+def pytest_runtest_logreport(report):
+    """Stream each test outcome to the --progress-report file, if requested."""
+    path = _progress_report_path
+    if path is None or not (report.when == "call" or report.failed):
+        return
+
+    line = json.dumps(
+        {
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": report.outcome,
+            "duration": report.duration,
+        }
+    )
+    # One O_APPEND write per line, so a reader never sees a partial record
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (line + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
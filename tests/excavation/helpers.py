@@ -0,0 +1,11 @@
+"""
+Shared constants for the excavation tests.
+"""
+
+from warp_content_processor.excavation.artifacts import ContaminationType
+
+# The first n contamination types, for each n; indexed by a parametrized count
+CONTAMINATION_SLICES = tuple(
+    frozenset(list(ContaminationType)[:count])
+    for count in range(len(ContaminationType) + 1)
+)
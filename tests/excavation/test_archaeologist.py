@@ -4,6 +4,8 @@ Tests for ContentArchaeologist - Following KISS principles with parameterized te
 No loops in tests - using parameterization and fixtures for clean test logic.
 """
 
+import itertools
+from dataclasses import fields
 from unittest.mock import Mock, patch
 
 import pytest
@@ -14,21 +16,47 @@ from warp_content_processor.excavation.artifacts import (
     ExtractionConfidence,
     SchemaArtifact,
 )
+from warp_content_processor.excavation.island_detector import ContentIsland
 from warp_content_processor.utils.security import SecurityValidationError
 
+from .helpers import CONTAMINATION_SLICES
+
+# Parameter matrices are built once at import and shared by every collection
+_INIT_PARAMS = (
+    pytest.param(1024, 30, 1024, 30, 0, id="small-limits"),
+    pytest.param(
+        100 * 1024 * 1024, 300, 100 * 1024 * 1024, 300, 0, id="default-limits"
+    ),
+    pytest.param(
+        1000 * 1024 * 1024, 600, 1000 * 1024 * 1024, 600, 0, id="large-limits"
+    ),
+    pytest.param(0, 300, 0, 300, 0, id="invalid-size"),  # Still initializes
+    pytest.param(1024, 0, 1024, 0, 0, id="invalid-timeout"),  # Still initializes
+)
+
+_CONFIDENCE_PARAMS = (
+    pytest.param(0.9, 0.9, 0, ExtractionConfidence.HIGH, id="high-clean"),
+    pytest.param(0.7, 0.7, 0, ExtractionConfidence.MEDIUM, id="medium"),
+    pytest.param(0.5, 0.5, 1, ExtractionConfidence.LOW, id="low-contaminated"),
+    pytest.param(0.3, 0.3, 2, ExtractionConfidence.SUSPECT, id="poor-contaminated"),
+    pytest.param(0.0, 0.0, 3, ExtractionConfidence.SUSPECT, id="very-poor"),
+)
+
+# Attributes the archaeologist reads from a parser result
+_PARSE_RESULT_FIELDS = ["success", "data", "error_message"]
+
+# Shared inputs
+_MINIMAL_YAML = "name: test"
+_SAMPLE_YAML = "name: test\nvalue: 123"
+_OVERSIZED_CONTENT = "x" * 200  # Exceeds the 100 byte limit in the security tests
+
 
 class TestContentArchaeologistInitialization:
     """Test archaeologist initialization with different configurations."""
 
     @pytest.mark.parametrize(
         "max_size,timeout,expected_max_size,expected_timeout,expected_extractions",
-        [
-            (1024, 30, 1024, 30, 0),  # Small limits
-            (100 * 1024 * 1024, 300, 100 * 1024 * 1024, 300, 0),  # Default limits
-            (1000 * 1024 * 1024, 600, 1000 * 1024 * 1024, 600, 0),  # Large limits
-            (0, 300, 0, 300, 0),  # Invalid size (still initializes)
-            (1024, 0, 1024, 0, 0),  # Invalid timeout (still initializes)
-        ],
+        _INIT_PARAMS,
     )
     def test_initialization_parameters(
         self,
@@ -54,35 +82,61 @@ class TestContentArchaeologistExcavation:
         """Create a standard archaeologist for testing."""
         return ContentArchaeologist(max_content_size=1024 * 1024, extraction_timeout=60)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_dependencies(self):
-        """Mock all external dependencies."""
-        with patch(
-            "warp_content_processor.excavation.archaeologist.ContentTypeDetector"
-        ) as mock_detector, patch(
-            "warp_content_processor.excavation.archaeologist.SchemaIslandDetector"
-        ) as mock_island, patch(
-            "warp_content_processor.excavation.archaeologist.create_yaml_parser"
-        ) as mock_parser:
-            # Setup mock returns
-            mock_detector.return_value.detect.return_value = ("yaml", 0.9)
-            mock_island.return_value.find_islands.return_value = []
-            mock_parser.return_value.parse.return_value = Mock(
-                success=True, data={"key": "value"}, error_message=None
-            )
-
-            yield {
-                "detector": mock_detector,
-                "island": mock_island,
-                "parser": mock_parser,
-            }
+        """Mock all external dependencies once for the whole class."""
+        patchers = [
+            patch(
+                "warp_content_processor.excavation.archaeologist.ContentTypeDetector"
+            ),
+            patch(
+                "warp_content_processor.excavation.archaeologist.SchemaIslandDetector",
+                autospec=True,
+            ),
+            patch(
+                "warp_content_processor.excavation.archaeologist.create_yaml_parser",
+                autospec=True,
+            ),
+        ]
+        mock_detector, mock_island, mock_parser = [p.start() for p in patchers]
+
+        yield {
+            "detector": mock_detector,
+            "island": mock_island,
+            "parser": mock_parser,
+        }
+
+        for patcher in reversed(patchers):
+            patcher.stop()
+
+    @pytest.fixture(autouse=True)
+    def reset_mock_dependencies(self, mock_dependencies):
+        """Reset the shared mocks and their default returns before each test."""
+        for mock in mock_dependencies.values():
+            mock.reset_mock()
+
+        detect = mock_dependencies["detector"].return_value.detect
+        find_islands = mock_dependencies["island"].return_value.find_islands
+        parse = mock_dependencies["parser"].return_value.parse
+        for method in (detect, find_islands, parse):
+            method.reset_mock(return_value=True, side_effect=True)
+
+        # Setup mock returns
+        detect.return_value = ("yaml", 0.9)
+        find_islands.return_value = []
+        parse.return_value = Mock(
+            spec=_PARSE_RESULT_FIELDS,
+            success=True,
+            data={"key": "value"},
+            error_message=None,
+        )
 
     @pytest.mark.parametrize(
         "content,source_hint,expected_artifact_count",
         [
             ("", None, 0),  # Empty content
             ("   ", None, 0),  # Whitespace only
-            ("name: test\nvalue: 123", "yaml", 1),  # Valid YAML
+            (_SAMPLE_YAML, "yaml", 1),  # Valid YAML
             ("random text without structure", None, 0),  # No structure
             ("name: test\n---\nother: data", "yaml", 2),  # Multiple sections
         ],
@@ -96,9 +150,11 @@ class TestContentArchaeologistExcavation:
         expected_artifact_count,
     ):
         """Test excavation with basic content scenarios."""
+        find_islands = mock_dependencies["island"].return_value.find_islands
+
         # Setup mock island detector to return appropriate islands
         if expected_artifact_count > 0:
-            mock_island = Mock()
+            mock_island = Mock(spec=ContentIsland)
             mock_island.content = content
             mock_island.raw_content = content
             mock_island.start_offset = 0
@@ -110,13 +166,10 @@ class TestContentArchaeologistExcavation:
             mock_island.cleaning_warnings = []
             mock_island.surrounding_context = content
 
-            mock_dependencies["island"].return_value.find_islands.return_value = [
-                mock_island
-            ] * expected_artifact_count
+            find_islands.return_value = [mock_island] * expected_artifact_count
 
         result = archaeologist.excavate(content, source_hint)
 
-        assert isinstance(result, ExcavationResult)
         assert len(result.artifacts) == expected_artifact_count
         assert result.total_content_size == len(content)
         assert result.processing_time_ms >= 0
@@ -174,35 +227,26 @@ class TestSecurityValidation:
 
     def test_content_size_limit(self, archaeologist):
         """Test content size limits are enforced."""
-        oversized_content = "x" * 200  # Exceeds 100 byte limit
-
-        result = archaeologist.excavate(oversized_content)
+        result = archaeologist.excavate(_OVERSIZED_CONTENT)
 
         # Should truncate content and continue processing
-        assert isinstance(result, ExcavationResult)
-        assert result.total_content_size == 200  # Original size preserved in stats
+        # Original size preserved in stats
+        assert result.total_content_size == len(_OVERSIZED_CONTENT)
 
-    def test_extraction_timeout(self, archaeologist):
+    def test_extraction_timeout(self, archaeologist, monkeypatch):
         """Test extraction timeout is enforced."""
-        with patch("time.time") as mock_time:
-            # Simulate timeout condition - provide enough values for all
-            # time.time() calls
-            # Include extra values to handle logging and other internal time calls
-            mock_time.side_effect = [
-                0,  # Initial start time
-                0,  # Check during processing
-                10,  # Timeout check (exceeds 5 second limit)
-                10,  # Additional calls from logging
-                10,  # Additional calls from logging
-                10,  # Additional calls from logging
-                10,  # Additional calls from logging
-                10,  # Fallback for any extra calls
-            ]
-
-            result = archaeologist.excavate("name: test")
-
-            # Should handle timeout gracefully
-            assert isinstance(result, ExcavationResult)
+        # Simulate timeout condition: start, one check during processing, then
+        # every later call (timeout check, logging) is past the limit
+        ticks = itertools.chain([0.0, 0.0], itertools.repeat(10.0))
+        monkeypatch.setattr(
+            "warp_content_processor.excavation.archaeologist.time.time",
+            lambda: next(ticks),
+        )
+
+        result = archaeologist.excavate(_MINIMAL_YAML)
+
+        # Should handle timeout gracefully
+        assert isinstance(result, ExcavationResult)
 
 
 class TestExtractionStatistics:
@@ -212,8 +256,8 @@ class TestExtractionStatistics:
     def archaeologist(self):
         return ContentArchaeologist()
 
-    def test_statistics_tracking(self, archaeologist):
-        """Test that statistics are tracked correctly."""
+    def test_statistics_lifecycle(self, archaeologist):
+        """Test that statistics are tracked correctly and can be reset."""
         initial_stats = archaeologist.get_extraction_statistics()
 
         assert initial_stats["total_extractions"] == 0
@@ -221,15 +265,12 @@ class TestExtractionStatistics:
         assert initial_stats["success_rate"] == 0.0
 
         # Perform some extractions
-        archaeologist.excavate("name: test")
+        archaeologist.excavate(_MINIMAL_YAML)
         archaeologist.excavate("invalid content")
 
         updated_stats = archaeologist.get_extraction_statistics()
         assert updated_stats["total_extractions"] == 2
 
-    def test_statistics_reset(self, archaeologist):
-        """Test statistics can be reset."""
-        archaeologist.excavate("name: test")
         archaeologist.reset_statistics()
 
         stats = archaeologist.get_extraction_statistics()
@@ -240,16 +281,16 @@ class TestExtractionStatistics:
 class TestArtifactExtraction:
     """Test artifact extraction from islands."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def archaeologist(self):
         return ContentArchaeologist()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_island(self):
         """Create a mock content island."""
-        island = Mock()
-        island.content = "name: test\nvalue: 123"
-        island.raw_content = "name: test\nvalue: 123"
+        island = Mock(spec=ContentIsland)
+        island.content = _SAMPLE_YAML
+        island.raw_content = _SAMPLE_YAML
         island.start_offset = 0
         island.end_offset = 17
         island.quality_score = 0.8
@@ -257,7 +298,7 @@ class TestArtifactExtraction:
         island.extraction_method = "yaml_block"
         island.contamination_types = set()
         island.cleaning_warnings = []
-        island.surrounding_context = "name: test\nvalue: 123"
+        island.surrounding_context = _SAMPLE_YAML
         return island
 
     @pytest.mark.parametrize(
@@ -277,7 +318,7 @@ class TestArtifactExtraction:
             # Setup mocks
             mock_detector.detect.return_value = ("yaml", 0.9)
 
-            parse_result = Mock()
+            parse_result = Mock(spec=_PARSE_RESULT_FIELDS)
             parse_result.success = parse_success
             parse_result.data = (
                 {"name": "test", "value": 123} if parse_success else None
@@ -303,28 +344,12 @@ class TestArtifactExtraction:
 class TestConfidenceCalculation:
     """Test extraction confidence calculation."""
 
-    @pytest.fixture
-    def archaeologist(self):
-        return ContentArchaeologist()
-
     @pytest.mark.parametrize(
         "island_quality,detection_confidence,contamination_count,expected_confidence",
-        [
-            (0.9, 0.9, 0, ExtractionConfidence.HIGH),  # High quality, no contamination
-            (0.7, 0.7, 0, ExtractionConfidence.MEDIUM),  # Medium quality
-            (0.5, 0.5, 1, ExtractionConfidence.LOW),  # Lower quality with contamination
-            (
-                0.3,
-                0.3,
-                2,
-                ExtractionConfidence.SUSPECT,
-            ),  # Poor quality, multiple contaminations
-            (0.0, 0.0, 3, ExtractionConfidence.SUSPECT),  # Very poor quality
-        ],
+        _CONFIDENCE_PARAMS,
     )
     def test_confidence_calculation(
         self,
-        archaeologist,
         island_quality,
         detection_confidence,
         contamination_count,
@@ -332,13 +357,11 @@ class TestConfidenceCalculation:
     ):
         """Test confidence calculation with various quality metrics."""
         # Create mock island with specified quality
-        mock_island = Mock()
+        mock_island = Mock(spec=ContentIsland)
         mock_island.quality_score = island_quality
-        mock_island.contamination_types = set(
-            range(contamination_count)
-        )  # Mock contamination types
+        mock_island.contamination_types = CONTAMINATION_SLICES[contamination_count]
 
-        confidence = archaeologist._calculate_extraction_confidence(
+        confidence = ContentArchaeologist._calculate_extraction_confidence(
             mock_island, detection_confidence
         )
 
@@ -351,13 +374,15 @@ class TestExcavationResultStructure:
     def test_excavation_result_completeness(self):
         """Test that excavation results contain all required fields."""
         archaeologist = ContentArchaeologist()
-        result = archaeologist.excavate("name: test")
+        result = archaeologist.excavate(_MINIMAL_YAML)
 
         # Check all required fields are present
-        assert hasattr(result, "artifacts")
-        assert hasattr(result, "total_content_size")
-        assert hasattr(result, "processing_time_ms")
-        assert hasattr(result, "extraction_stats")
+        assert {
+            "artifacts",
+            "total_content_size",
+            "processing_time_ms",
+            "extraction_stats",
+        } <= {field.name for field in fields(result)}
 
         # Check types
         assert isinstance(result.artifacts, list)
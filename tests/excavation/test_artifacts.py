@@ -4,6 +4,7 @@ Tests for excavation artifacts - Following KISS principles with parameterized te
 Tests data structures and validation logic without complex test loops.
 """
 
+import functools
 from dataclasses import FrozenInstanceError
 
 import pytest
@@ -17,6 +18,75 @@ from warp_content_processor.excavation.artifacts import (
     SchemaArtifact,
 )
 
+from .helpers import CONTAMINATION_SLICES
+
+
+# Frozen, so instances built from the same arguments can be shared by every
+# case that needs them
+@functools.lru_cache(maxsize=None)
+def _test_context(start_offset: int, end_offset: int) -> ExtractionContext:
+    """Return a plain test extraction context for an offset range."""
+    return ExtractionContext(
+        source_type="test",
+        start_offset=start_offset,
+        end_offset=end_offset,
+        contamination_types=set(),
+        extraction_method="test",
+        original_surrounding="",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _test_artifact() -> SchemaArtifact:
+    """Return a plain valid test artifact."""
+    return SchemaArtifact(
+        content_type=ContentType.YAML,
+        raw_content="test",
+        cleaned_content="test",
+        parsed_data={"test": 0},
+        confidence=ExtractionConfidence.MEDIUM,
+        is_valid=True,
+        extraction_context=_test_context(0, 10),
+        validation_errors=[],
+        cleaning_warnings=[],
+    )
+
+
+def _build_quality_tiers():
+    """Tabulate the quality tier for every confidence/contamination count pair."""
+    # Quality score mapping for confidence levels
+    confidence_scores = {
+        ExtractionConfidence.HIGH: 1.0,
+        ExtractionConfidence.MEDIUM: 0.8,
+        ExtractionConfidence.LOW: 0.6,
+        ExtractionConfidence.SUSPECT: 0.4,
+    }
+    tier_thresholds = [
+        (0.9, "excellent"),
+        (0.7, "good"),
+        (0.5, "fair"),
+        (0.3, "poor"),
+    ]
+
+    tiers = {}
+    for confidence, base_score in confidence_scores.items():
+        for count in range(len(ContaminationType) + 1):
+            # Reduce for contamination
+            quality_score = base_score - count * 0.1
+            tiers[confidence, count] = next(
+                (
+                    tier
+                    for threshold, tier in tier_thresholds
+                    if quality_score >= threshold
+                ),
+                "very_poor",
+            )
+    return tiers
+
+
+# Computed once at import; the quality tests only look tiers up
+_QUALITY_TIERS = _build_quality_tiers()
+
 
 class TestExtractionConfidence:
     """Test ExtractionConfidence enum."""
@@ -78,7 +148,7 @@ class TestContentType:
 class TestExtractionContext:
     """Test ExtractionContext dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def basic_context(self):
         """Create a basic extraction context for testing."""
         return ExtractionContext(
@@ -92,51 +162,41 @@ class TestExtractionContext:
 
     def test_context_creation(self, basic_context):
         """Test that extraction context can be created correctly."""
-        assert basic_context.source_type == "test_source"
-        assert basic_context.start_offset == 0
-        assert basic_context.end_offset == 100
         assert ContaminationType.LOG_PREFIXES in basic_context.contamination_types
-        assert basic_context.extraction_method == "test_method"
-        assert basic_context.original_surrounding == "surrounding context"
-
-    def test_context_immutability(self, basic_context):
-        """Test that extraction context is immutable (frozen dataclass)."""
-        with pytest.raises((FrozenInstanceError, AttributeError)):
-            basic_context.source_type = "modified"
+        assert {
+            "source_type": basic_context.source_type,
+            "start_offset": basic_context.start_offset,
+            "end_offset": basic_context.end_offset,
+            "extraction_method": basic_context.extraction_method,
+            "original_surrounding": basic_context.original_surrounding,
+        } == {
+            "source_type": "test_source",
+            "start_offset": 0,
+            "end_offset": 100,
+            "extraction_method": "test_method",
+            "original_surrounding": "surrounding context",
+        }
 
-    @pytest.mark.parametrize(
-        "start,end,valid",
-        [
-            (0, 100, True),  # Normal range
-            (50, 50, True),  # Single position
-            (100, 0, False),  # Invalid range (end < start)
-            (-1, 100, False),  # Negative start
-            (0, -1, False),  # Negative end
-        ],
-    )
-    def test_context_offset_validation(self, start, end, valid):
-        """Test extraction context with various offset values."""
-        # Create context regardless (validation is not enforced by dataclass)
+    def test_context_offsets_stored_unvalidated(self):
+        """Test that offsets are stored as-is, even when out of order or negative."""
+        # Validation is not enforced by the dataclass
         context = ExtractionContext(
             source_type="test",
-            start_offset=start,
-            end_offset=end,
+            start_offset=100,
+            end_offset=-1,
             contamination_types=set(),
             extraction_method="test",
             original_surrounding="",
         )
-        # Values are stored as-is
-        assert context.start_offset == start
-        assert context.end_offset == end
 
-        # For valid ranges, additional checks could be added
-        # Use parameterized test patterns instead of conditionals
+        assert context.start_offset == 100
+        assert context.end_offset == -1
 
 
 class TestSchemaArtifact:
     """Test SchemaArtifact dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def basic_artifact(self):
         """Create a basic schema artifact for testing."""
         context = ExtractionContext(
@@ -162,19 +222,25 @@ class TestSchemaArtifact:
 
     def test_artifact_creation(self, basic_artifact):
         """Test that schema artifact can be created correctly."""
-        assert basic_artifact.content_type == ContentType.YAML
-        assert basic_artifact.raw_content == "name: test\nvalue: 123"
-        assert basic_artifact.cleaned_content == "name: test\nvalue: 123"
-        assert basic_artifact.parsed_data == {"name": "test", "value": 123}
-        assert basic_artifact.confidence == ExtractionConfidence.HIGH
-        assert basic_artifact.is_valid is True
-        assert len(basic_artifact.validation_errors) == 0
-        assert len(basic_artifact.cleaning_warnings) == 0
-
-    def test_artifact_immutability(self, basic_artifact):
-        """Test that schema artifact is immutable."""
-        with pytest.raises((FrozenInstanceError, AttributeError)):
-            basic_artifact.is_valid = False
+        assert {
+            "content_type": basic_artifact.content_type,
+            "raw_content": basic_artifact.raw_content,
+            "cleaned_content": basic_artifact.cleaned_content,
+            "parsed_data": basic_artifact.parsed_data,
+            "confidence": basic_artifact.confidence,
+            "is_valid": basic_artifact.is_valid,
+            "validation_errors": basic_artifact.validation_errors,
+            "cleaning_warnings": basic_artifact.cleaning_warnings,
+        } == {
+            "content_type": ContentType.YAML,
+            "raw_content": "name: test\nvalue: 123",
+            "cleaned_content": "name: test\nvalue: 123",
+            "parsed_data": {"name": "test", "value": 123},
+            "confidence": ExtractionConfidence.HIGH,
+            "is_valid": True,
+            "validation_errors": [],
+            "cleaning_warnings": [],
+        }
 
     @pytest.mark.parametrize(
         "is_valid,parsed_data,validation_errors",
@@ -189,15 +255,6 @@ class TestSchemaArtifact:
         self, is_valid, parsed_data, validation_errors
     ):
         """Test artifact with various validation states."""
-        context = ExtractionContext(
-            source_type="test",
-            start_offset=0,
-            end_offset=10,
-            contamination_types=set(),
-            extraction_method="test",
-            original_surrounding="",
-        )
-
         artifact = SchemaArtifact(
             content_type=ContentType.YAML,
             raw_content="test",
@@ -205,7 +262,7 @@ class TestSchemaArtifact:
             parsed_data=parsed_data,
             confidence=ExtractionConfidence.MEDIUM,
             is_valid=is_valid,
-            extraction_context=context,
+            extraction_context=_test_context(0, 10),
             validation_errors=validation_errors,
             cleaning_warnings=[],
         )
@@ -240,15 +297,17 @@ class TestSchemaArtifact:
             cleaning_warnings=["Removed log prefix", "Removed binary data"],
         )
 
-        assert len(artifact.extraction_context.contamination_types) == 2
-        assert len(artifact.cleaning_warnings) == 2
         assert artifact.raw_content != artifact.cleaned_content
+        assert {
+            "contamination_types": len(artifact.extraction_context.contamination_types),
+            "cleaning_warnings": len(artifact.cleaning_warnings),
+        } == {"contamination_types": 2, "cleaning_warnings": 2}
 
 
 class TestExcavationResult:
     """Test ExcavationResult dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_artifacts(self):
         """Create sample artifacts for testing."""
         context1 = ExtractionContext(
@@ -304,23 +363,19 @@ class TestExcavationResult:
             extraction_stats={"yaml_block": 1, "json_block": 1},
         )
 
-        assert len(result.artifacts) == 2
-        assert result.total_content_size == 1000
-        assert result.processing_time_ms == 250
-        assert result.extraction_stats["yaml_block"] == 1
-        assert result.extraction_stats["json_block"] == 1
-
-    def test_excavation_result_immutability(self, sample_artifacts):
-        """Test that excavation result is immutable."""
-        result = ExcavationResult(
-            artifacts=sample_artifacts,
-            total_content_size=1000,
-            processing_time_ms=250,
-            extraction_stats={},
-        )
-
-        with pytest.raises((FrozenInstanceError, AttributeError)):
-            result.total_content_size = 2000
+        assert {
+            "artifacts": len(result.artifacts),
+            "total_content_size": result.total_content_size,
+            "processing_time_ms": result.processing_time_ms,
+            "yaml_block": result.extraction_stats["yaml_block"],
+            "json_block": result.extraction_stats["json_block"],
+        } == {
+            "artifacts": 2,
+            "total_content_size": 1000,
+            "processing_time_ms": 250,
+            "yaml_block": 1,
+            "json_block": 1,
+        }
 
     @pytest.mark.parametrize(
         "artifact_count,content_size,processing_time",
@@ -351,27 +406,9 @@ class TestExcavationResult:
 
     def _create_mock_artifacts(self, count):
         """Helper to create mock artifacts for testing."""
-        return [
-            SchemaArtifact(
-                content_type=ContentType.YAML,
-                raw_content=f"test{i}",
-                cleaned_content=f"test{i}",
-                parsed_data={"test": i},
-                confidence=ExtractionConfidence.MEDIUM,
-                is_valid=True,
-                extraction_context=ExtractionContext(
-                    source_type="test",
-                    start_offset=i * 10,
-                    end_offset=(i + 1) * 10,
-                    contamination_types=set(),
-                    extraction_method="test",
-                    original_surrounding="",
-                ),
-                validation_errors=[],
-                cleaning_warnings=[],
-            )
-            for i in range(count)
-        ]
+        # The metrics tests only count the list, so one artifact stands in
+        # for all of them
+        return [_test_artifact()] * count
 
     def test_empty_excavation_result(self):
         """Test creation of empty excavation result."""
@@ -388,6 +425,33 @@ class TestExcavationResult:
         assert len(result.extraction_stats) == 0
 
 
+class TestImmutability:
+    """Test that the artifact dataclasses are frozen."""
+
+    @pytest.mark.parametrize(
+        "instance,attribute,value",
+        [
+            pytest.param(_test_context(0, 10), "source_type", "modified", id="context"),
+            pytest.param(_test_artifact(), "is_valid", False, id="artifact"),
+            pytest.param(
+                ExcavationResult(
+                    artifacts=[],
+                    total_content_size=1000,
+                    processing_time_ms=250,
+                    extraction_stats={},
+                ),
+                "total_content_size",
+                2000,
+                id="excavation-result",
+            ),
+        ],
+    )
+    def test_frozen_dataclass_immutability(self, instance, attribute, value):
+        """Test that assigning to a field of a frozen dataclass fails."""
+        with pytest.raises((FrozenInstanceError, AttributeError)):
+            setattr(instance, attribute, value)
+
+
 class TestArtifactQualityMetrics:
     """Test quality metrics and scoring for artifacts."""
 
@@ -416,7 +480,7 @@ class TestArtifactQualityMetrics:
         self, confidence, contamination_count, expected_quality_tier
     ):
         """Test quality assessment based on confidence and contamination."""
-        contamination_types = set(list(ContaminationType)[:contamination_count])
+        contamination_types = CONTAMINATION_SLICES[contamination_count]
 
         # artifact = SchemaArtifact(
         #     content_type=ContentType.YAML,
@@ -436,33 +500,4 @@ class TestArtifactQualityMetrics:
 
     def _calculate_quality_tier(self, confidence, contamination_types):
         """Helper to calculate quality tier based on confidence and contamination."""
-        # Quality score mapping for confidence levels
-        confidence_scores = {
-            ExtractionConfidence.HIGH: 1.0,
-            ExtractionConfidence.MEDIUM: 0.8,
-            ExtractionConfidence.LOW: 0.6,
-            ExtractionConfidence.SUSPECT: 0.4,
-        }
-
-        quality_score = confidence_scores.get(confidence, 0.0)
-
-        # Reduce for contamination
-        quality_score -= len(contamination_types) * 0.1
-
-        # Quality tier thresholds using a more functional approach
-        tier_thresholds = [
-            (0.9, "excellent"),
-            (0.7, "good"),
-            (0.5, "fair"),
-            (0.3, "poor"),
-            (0.0, "very_poor"),
-        ]
-
-        # Find the first threshold that the quality score meets
-        # Add a default fallback for very low scores
-        for threshold, tier in tier_thresholds:
-            if quality_score >= threshold:
-                return tier
-
-        # Fallback for extremely low scores
-        return "very_poor"
+        return _QUALITY_TIERS[confidence, len(contamination_types)]
@@ -4,7 +4,9 @@ Tests for SchemaIslandDetector - Following KISS principles with parameterized te
 Tests focus on specific behaviors without complex loops in test logic.
 """
 
-from typing import Set
+import json
+from dataclasses import replace
+from typing import FrozenSet
 
 import pytest
 
@@ -14,6 +16,58 @@ from warp_content_processor.excavation.island_detector import (
     SchemaIslandDetector,
 )
 
+from .helpers import CONTAMINATION_SLICES
+
+# Expected contamination sets, shared by the parametrized cases
+_CLEAN: FrozenSet[ContaminationType] = frozenset()
+_LOG = frozenset({ContaminationType.LOG_PREFIXES})
+_BINARY = frozenset({ContaminationType.BINARY_DATA})
+_CODE = frozenset({ContaminationType.CODE_FRAGMENTS})
+_RANDOM = frozenset({ContaminationType.RANDOM_TEXT})
+
+# Serialized once; the nested JSON test only reads it
+_NESTED_JSON = json.dumps({"outer": {"inner": {"deep": "value"}}})
+
+# A 250-letter run ahead of a YAML line, for the random text detector
+_RANDOM_TEXT_SAMPLE = "verylongwordwithnomeaning" * 10 + "\nname: test"
+
+
+# Shared fields of the islands built by _make_island
+_ISLAND_TEMPLATE = ContentIsland(
+    content="",
+    raw_content="",
+    start_offset=0,
+    end_offset=0,
+    quality_score=0.0,
+    source_type="test",
+    extraction_method="test",
+    contamination_types=set(),
+    cleaning_warnings=[],
+    surrounding_context="",
+)
+
+
+def _make_island(start: int, end: int, quality: float) -> ContentIsland:
+    """Build a plain island covering an offset range."""
+    tag = f"test{start}"
+    return replace(
+        _ISLAND_TEMPLATE,
+        content=tag,
+        raw_content=tag,
+        start_offset=start,
+        end_offset=end,
+        quality_score=quality,
+        # Fresh containers per island, as the detector may mutate them
+        contamination_types=set(),
+        cleaning_warnings=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Create one detector per session, so one per xdist worker; it is read-only."""
+    return SchemaIslandDetector()
+
 
 class TestSchemaIslandDetectorInitialization:
     """Test island detector initialization."""
@@ -33,18 +87,14 @@ class TestSchemaIslandDetectorInitialization:
 
     def _verify_compiled_patterns(self, patterns):
         """Helper to verify patterns are compiled regex objects."""
-        for pattern in patterns:
-            assert hasattr(pattern, "search")  # Compiled regex
+        assert all(
+            hasattr(pattern, "search") for pattern in patterns
+        ), "non-compiled pattern present"
 
 
 class TestYamlIslandDetection:
     """Test YAML island detection functionality."""
 
-    @pytest.fixture
-    def detector(self):
-        """Create a detector for testing."""
-        return SchemaIslandDetector()
-
     @pytest.mark.parametrize(
         "content,expected_count",
         [
@@ -60,8 +110,10 @@ class TestYamlIslandDetection:
     def test_yaml_island_detection_count(self, detector, content, expected_count):
         """Test YAML island detection with various content types."""
         islands = detector.find_islands(content)
-        yaml_islands = [i for i in islands if i.extraction_method == "yaml_block"]
-        assert len(yaml_islands) == expected_count
+        assert (
+            sum(island.extraction_method == "yaml_block" for island in islands)
+            == expected_count
+        )
 
     @pytest.mark.parametrize(
         "yaml_content,expected_quality_range,should_find_islands",
@@ -79,6 +131,7 @@ class TestYamlIslandDetection:
                 False,  # No islands found for severely broken content
             ),  # Mixed quality - detector may not find islands
         ],
+        ids=["simple", "complex", "commented", "broken"],
     )
     def test_yaml_island_quality_scoring(
         self, detector, yaml_content, expected_quality_range, should_find_islands
@@ -111,10 +164,6 @@ class TestYamlIslandDetection:
 class TestJsonIslandDetection:
     """Test JSON island detection functionality."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     @pytest.mark.parametrize(
         "content,expected_count",
         [
@@ -132,13 +181,14 @@ class TestJsonIslandDetection:
     def test_json_island_detection_count(self, detector, content, expected_count):
         """Test JSON island detection with various content types."""
         islands = detector.find_islands(content)
-        json_islands = [i for i in islands if i.extraction_method == "json_block"]
-        assert len(json_islands) == expected_count
+        assert (
+            sum(island.extraction_method == "json_block" for island in islands)
+            == expected_count
+        )
 
     def test_nested_json_detection(self, detector):
         """Test detection of nested JSON structures."""
-        nested_content = '{"outer": {"inner": {"deep": "value"}}}'
-        islands = detector.find_islands(nested_content)
+        islands = detector.find_islands(_NESTED_JSON)
 
         # Should find the complete outer structure, not inner parts
         json_islands = [i for i in islands if i.extraction_method == "json_block"]
@@ -153,39 +203,20 @@ class TestJsonIslandDetection:
 class TestContaminationDetection:
     """Test contamination detection in content islands."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     @pytest.mark.parametrize(
         "content,expected_contamination_types",
         [
-            ("name: test", set()),  # Clean content
-            (
-                "2024-01-01 INFO: name: test",
-                {ContaminationType.LOG_PREFIXES},
-            ),  # Log prefix
-            (
-                "name: test\x00\x01binary",
-                {ContaminationType.BINARY_DATA},
-            ),  # Binary data
-            (
-                "def function():\n    name: test",
-                {ContaminationType.CODE_FRAGMENTS},
-            ),  # Code
-            (
-                "verylongwordwithnomeaning" * 10 + "\nname: test",
-                {ContaminationType.RANDOM_TEXT},
-            ),  # Random text
+            ("name: test", _CLEAN),  # Clean content
+            ("2024-01-01 INFO: name: test", _LOG),  # Log prefix
+            ("name: test\x00\x01binary", _BINARY),  # Binary data
+            ("def function():\n    name: test", _CODE),  # Code
+            (_RANDOM_TEXT_SAMPLE, _RANDOM),  # Random text
             (
                 "2024-01-01 ERROR: def func(): \x00",
-                {
-                    ContaminationType.LOG_PREFIXES,
-                    ContaminationType.CODE_FRAGMENTS,
-                    ContaminationType.BINARY_DATA,
-                },
+                _LOG | _CODE | _BINARY,
             ),  # Multiple contaminations
         ],
+        ids=["clean", "log_prefix", "binary", "code", "random_text", "combined"],
     )
     def test_contamination_detection(
         self, detector, content, expected_contamination_types
@@ -201,10 +232,6 @@ class TestContaminationDetection:
 class TestContentCleaning:
     """Test content cleaning functionality."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     @pytest.mark.parametrize(
         "contaminated_content,expected_cleaned",
         [
@@ -220,11 +247,10 @@ class TestContentCleaning:
                 "name: test\n\n\nvalue: 123",
             ),  # Fixed: Only collapse 5+ newlines
         ],
+        ids=["clean", "log_prefix", "multi_log", "binary", "newlines"],
     )
     def test_content_cleaning(self, detector, contaminated_content, expected_cleaned):
         """Test content cleaning with various contamination types."""
-        contamination_types = set()
-
         # Detect contamination types using helper method
         contamination_types = self._detect_contamination_types(
             detector, contaminated_content
@@ -242,11 +268,7 @@ class TestContentCleaning:
 
     def _detect_contamination_types(self, detector, content):
         """Helper to detect contamination types in content."""
-        contamination_types = set()
-        for cont_type, pattern in detector.contamination_patterns.items():
-            if pattern.search(content):
-                contamination_types.add(cont_type)
-        return contamination_types
+        return detector._detect_contamination_types(content)
 
     def _validate_cleaning_warnings(self, contamination_types, warnings):
         """Helper to validate cleaning warnings based on contamination."""
@@ -259,10 +281,6 @@ class TestContentCleaning:
 class TestQualityScoring:
     """Test quality scoring for content islands."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     @pytest.mark.parametrize(
         "content,contamination_count,expected_score_range",
         [
@@ -285,13 +303,14 @@ class TestQualityScoring:
             ("", 0, (0.0, 0.0)),  # Empty content
             ("   ", 0, (0.0, 0.0)),  # Whitespace only
         ],
+        ids=["yaml", "yaml_list", "contaminated", "random_text", "empty", "blank"],
     )
     def test_quality_scoring(
         self, detector, content, contamination_count, expected_score_range
     ):
         """Test quality scoring with various content and contamination levels."""
-        # Mock contamination types
-        contamination_types = set(range(contamination_count))
+        # Scoring only counts the contamination types
+        contamination_types = CONTAMINATION_SLICES[contamination_count]
 
         score = detector._calculate_quality_score(content, contamination_types)
 
@@ -302,106 +321,33 @@ class TestQualityScoring:
 class TestOverlapRemoval:
     """Test removal of overlapping islands."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     def test_overlap_detection(self, detector):
         """Test that overlapping islands are detected correctly."""
-        island1 = ContentIsland(
-            content="test1",
-            raw_content="test1",
-            start_offset=0,
-            end_offset=10,
-            quality_score=0.8,
-            source_type="test",
-            extraction_method="test",
-            contamination_types=set(),
-            cleaning_warnings=[],
-            surrounding_context="",
-        )
-
-        island2 = ContentIsland(
-            content="test2",
-            raw_content="test2",
-            start_offset=5,
-            end_offset=15,
-            quality_score=0.6,
-            source_type="test",
-            extraction_method="test",
-            contamination_types=set(),
-            cleaning_warnings=[],
-            surrounding_context="",
-        )
-
-        island3 = ContentIsland(
-            content="test3",
-            raw_content="test3",
-            start_offset=20,
-            end_offset=30,
-            quality_score=0.9,
-            source_type="test",
-            extraction_method="test",
-            contamination_types=set(),
-            cleaning_warnings=[],
-            surrounding_context="",
-        )
-
-        islands = [island1, island2, island3]
+        islands = [
+            _make_island(0, 10, 0.8),
+            _make_island(5, 15, 0.6),
+            _make_island(20, 30, 0.9),
+        ]
         result = detector._remove_overlapping_islands(islands)
 
-        # Should keep the higher quality non-overlapping islands
-        assert (
-            len(result) == 2
-        )  # island1 and island3 (island2 overlaps with island1 but has lower quality)
-        assert island1 in result
-        assert island3 in result
-        assert island2 not in result
+        # Should keep the higher quality non-overlapping islands: the one at 5
+        # overlaps the one at 0 but has lower quality
+        assert len(result) == 2
+        assert {island.start_offset for island in result} == {0, 20}
 
     def test_no_overlaps(self, detector):
         """Test case where no islands overlap."""
-        island1 = ContentIsland(
-            content="test1",
-            raw_content="test1",
-            start_offset=0,
-            end_offset=10,
-            quality_score=0.8,
-            source_type="test",
-            extraction_method="test",
-            contamination_types=set(),
-            cleaning_warnings=[],
-            surrounding_context="",
-        )
-
-        island2 = ContentIsland(
-            content="test2",
-            raw_content="test2",
-            start_offset=15,
-            end_offset=25,
-            quality_score=0.6,
-            source_type="test",
-            extraction_method="test",
-            contamination_types=set(),
-            cleaning_warnings=[],
-            surrounding_context="",
-        )
-
-        islands = [island1, island2]
+        islands = [_make_island(0, 10, 0.8), _make_island(15, 25, 0.6)]
         result = detector._remove_overlapping_islands(islands)
 
         # Should keep all islands when no overlaps
         assert len(result) == 2
-        assert island1 in result
-        assert island2 in result
+        assert {island.start_offset for island in result} == {0, 15}
 
 
 class TestIntegrationScenarios:
     """Test complete island detection scenarios."""
 
-    @pytest.fixture
-    def detector(self):
-        return SchemaIslandDetector()
-
     def test_mixed_content_detection(self, detector):
         """Test detection in mixed content with multiple formats."""
         mixed_content = """
@@ -420,11 +366,8 @@ class TestIntegrationScenarios:
         islands = detector.find_islands(mixed_content)
 
         # Should find both YAML and JSON islands
-        yaml_islands = [i for i in islands if i.extraction_method == "yaml_block"]
-        json_islands = [i for i in islands if i.extraction_method == "json_block"]
-
-        assert len(yaml_islands) >= 1
-        assert len(json_islands) >= 1
+        assert any(i.extraction_method == "yaml_block" for i in islands)
+        assert any(i.extraction_method == "json_block" for i in islands)
 
         # Verify content includes expected elements
         for island in islands:
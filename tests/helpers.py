@@ -4,14 +4,37 @@
 Helper functions for tests.
 
 This module provides utility functions for reading mixed-content files,
-splitting YAML, and other common test operations without using conditionals.
+splitting YAML, and other common test operations, keeping conditionals out of
+the tests themselves.
 """
 
+import copy
+import io
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Files above this size are read through mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# Directories with fewer YAML files than this are validated without a pool
+_PARALLEL_VALIDATION_THRESHOLD = 8
+
+# A YAML document separator on a line of its own
+_DOCUMENT_SEPARATOR = re.compile(r"^---[ \t]*$", re.MULTILINE)
+
 
 def read_mixed_content_file(file_path: Union[str, Path]) -> str:
     """
@@ -25,7 +48,19 @@ def read_mixed_content_file(file_path: Union[str, Path]) -> str:
         IOError: If file can't be read
     """
     path = Path(file_path)
-    return path.read_text(encoding="utf-8")
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size <= _MMAP_THRESHOLD:
+            # One read and one decode, without a text-mode wrapper
+            content = handle.read().decode("utf-8")
+        else:
+            # Decode straight from the mapping, without a bytes copy of the file
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8")
+
+    # Match text mode's universal newline translation
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def split_yaml_documents(content: str) -> List[str]:
@@ -36,17 +71,57 @@ def split_yaml_documents(content: str) -> List[str]:
     Returns:
         List of individual YAML document strings
     """
-    # Split on YAML document separators
-    parts = content.split("---")
-
-    # Filter parts using list comprehension instead of loop
-    documents = [
-        part.strip()
-        for part in parts
-        if part.strip() and not part.strip().startswith("#")
+    # Split on separator lines only; a "---" inside a line is not a separator
+    return [
+        part
+        for part in map(str.strip, _DOCUMENT_SEPARATOR.split(content))
+        if part and not part.startswith("#")
     ]
 
-    return documents
+
+# Document templates for the large content generators; %(i)d marks where the
+# document number goes
+_MESSY_WORKFLOW_TEMPLATE = """
+---
+name:Workflow %(i)d
+command:echo "test %(i)d"&&ls -la
+description:Generated workflow number %(i)d
+tags:test,generated,item-%(i)d
+shells:bash,zsh
+arguments:
+-name:input
+ description:Input for workflow %(i)d
+ default_value:default-%(i)d
+"""
+
+_MANGLED_WORKFLOW_TEMPLATE = """
+name：Workflow %(i)d
+command：echo"test%(i)d"&&ls -la
+tags：[git，test，item%(i)d
+description：Workflow number %(i)d with issues
+"""
+
+
+def _render_documents(template: str, count: int, separator: str) -> str:
+    """
+    Render numbered copies of a template into one separated string.
+    Args:
+        template: Template whose only %-placeholder is ``%(i)d``
+        count: Number of documents to render
+        separator: Text placed between consecutive documents
+    Returns:
+        The documents joined by the separator
+    """
+    # Split around the placeholder once, so each document is one join of the
+    # fixed pieces instead of a fresh %-format parse
+    pieces = template.split("%(i)d")
+    buf = io.StringIO()
+    write = buf.write
+    for i in range(count):
+        if i:
+            write(separator)
+        write(str(i).join(pieces))
+    return buf.getvalue()
 
 
 def create_large_messy_content(count: int = 50) -> str:
@@ -57,20 +132,7 @@ def create_large_messy_content(count: int = 50) -> str:
     Returns:
         Large messy content string
     """
-    workflow_template = """
----
-name:Workflow {i}
-command:echo "test {i}"&&ls -la
-description:Generated workflow number {i}
-tags:test,generated,item-{i}
-shells:bash,zsh
-arguments:
--name:input
- description:Input for workflow {i}
- default_value:default-{i}
-"""
-
-    return "\n".join(workflow_template.format(i=i) for i in range(count))
+    return _render_documents(_MESSY_WORKFLOW_TEMPLATE, count, "\n")
 
 
 def create_large_mangled_content(count: int = 100) -> str:
@@ -81,27 +143,23 @@ def create_large_mangled_content(count: int = 100) -> str:
     Returns:
         Large mangled content string
     """
-    mangled_template = """
-name：Workflow {i}
-command：echo"test{i}"&&ls -la
-tags：[git，test，item{i}
-description：Workflow number {i} with issues
-"""
-
-    return "\n---\n".join(mangled_template.format(i=i) for i in range(count))
+    return _render_documents(_MANGLED_WORKFLOW_TEMPLATE, count, "\n---\n")
 
 
 def _validate_single_yaml_file(yaml_file: Path) -> Union[str, None]:
     """
-    Validate a single YAML file.
+    Validate the YAML syntax of a single file.
     Args:
         yaml_file: Path to YAML file to validate
     Returns:
         Error message if invalid, None if valid
     """
     try:
-        with open(yaml_file) as f:
-            yaml.safe_load(f)
+        # Bytes go straight to the parser, which detects the encoding itself.
+        # Only parser events are produced and dropped; no Python objects are
+        # built for the document
+        with open(yaml_file, "rb") as f:
+            deque(yaml.parse(f, Loader=_SafeLoader), maxlen=0)
         return None
     except yaml.YAMLError as e:
         return f"File {yaml_file} is not valid YAML: {e}"
@@ -121,11 +179,19 @@ def validate_output_yaml_files(output_dir: Union[str, Path]) -> List[str]:
         return []
 
     yaml_files = list(output_path.rglob("*.yaml"))
+    if not yaml_files:
+        return []
 
-    # Use list comprehension instead of loop
-    validation_results = [
-        _validate_single_yaml_file(yaml_file) for yaml_file in yaml_files
-    ]
+    if len(yaml_files) < _PARALLEL_VALIDATION_THRESHOLD:
+        validation_results = [_validate_single_yaml_file(f) for f in yaml_files]
+    else:
+        # Threads only overlap the file reads; the parser holds the GIL while
+        # it runs. Results come back in file order
+        workers = min(32, os.cpu_count() or 4, len(yaml_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            validation_results = list(
+                executor.map(_validate_single_yaml_file, yaml_files)
+            )
 
     # Filter out None values (valid files)
     errors = [error for error in validation_results if error is not None]
@@ -144,53 +210,51 @@ def extract_document_types(documents: List[Tuple[Any, str]]) -> List[str]:
     return [doc_type.value for doc_type, _ in documents]
 
 
+_CONTENT_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "workflow": {
+        "name": "Test Workflow",
+        "command": "echo test",
+        "shells": ["bash"],
+        "description": "A test workflow",
+    },
+    "prompt": {
+        "name": "Test Prompt",
+        "prompt": "Please {{action}} the following {{item}}",
+        "arguments": [
+            {"name": "action", "description": "Action to perform"},
+            {"name": "item", "description": "Item to process"},
+        ],
+    },
+    "rule": {
+        "title": "Test Rule",
+        "description": "A test rule",
+        "guidelines": ["Follow this guideline"],
+        "category": "testing",
+    },
+    "env_var": {"variables": {"TEST_VAR": "test_value"}, "scope": "user"},
+    "notebook": {
+        "title": "Test Notebook",
+        "description": "A test notebook",
+        "content": "# Test\n\n```bash\necho test\n```",
+    },
+}
+
+
 def create_test_content_by_type(content_type: str) -> Dict[str, Any]:
     """
     Create test content for a specific content type.
     Args:
         content_type: Type of content to create
     Returns:
-        Dictionary containing test content
-    """
-    content_templates = {
-        "workflow": {
-            "name": "Test Workflow",
-            "command": "echo test",
-            "shells": ["bash"],
-            "description": "A test workflow",
-        },
-        "prompt": {
-            "name": "Test Prompt",
-            "prompt": "Please {{action}} the following {{item}}",
-            "arguments": [
-                {"name": "action", "description": "Action to perform"},
-                {"name": "item", "description": "Item to process"},
-            ],
-        },
-        "rule": {
-            "title": "Test Rule",
-            "description": "A test rule",
-            "guidelines": ["Follow this guideline"],
-            "category": "testing",
-        },
-        "env_var": {"variables": {"TEST_VAR": "test_value"}, "scope": "user"},
-        "notebook": {
-            "title": "Test Notebook",
-            "description": "A test notebook",
-            "content": "# Test\n\n```bash\necho test\n```",
-        },
-    }
-
-    return content_templates.get(content_type, {})
+        Dictionary containing test content; each call gets its own copy,
+        nested lists included
+    """
+    return copy.deepcopy(_CONTENT_TEMPLATES.get(content_type, {}))
 
 
-def create_malicious_content_samples() -> Dict[str, str]:
-    """
-    Create samples of malicious content for security testing.
-    Returns:
-        Dictionary mapping attack type to malicious content
-    """
-    return {
+# Attack samples handed out by create_malicious_content_samples(), built once
+_MALICIOUS_CONTENT_SAMPLES: Mapping[str, str] = MappingProxyType(
+    {
         "script_injection": """
             name: Evil Workflow
             command: <script>alert('xss')</script>
@@ -202,6 +266,16 @@ def create_malicious_content_samples() -> Dict[str, str]:
         "command_substitution": "test $(evil_command)",
         "path_traversal": "path/../../etc/passwd",
     }
+)
+
+
+def create_malicious_content_samples() -> Mapping[str, str]:
+    """
+    Create samples of malicious content for security testing.
+    Returns:
+        Read-only mapping of attack type to malicious content
+    """
+    return _MALICIOUS_CONTENT_SAMPLES
 
 
 def create_unicode_test_content() -> str:
@@ -228,12 +302,12 @@ def create_deeply_nested_structure(depth: int = 25) -> Dict[str, Any]:
     Returns:
         Deeply nested dictionary structure
     """
-    structure = {"a": {"b": {"c": {"d": {}}}}}
-
-    # Use functools.reduce to build nested structure without explicit loop
-    from functools import reduce
+    structure: Dict[str, Any] = {"a": {"b": {"c": {"d": {}}}}}
 
-    return reduce(lambda acc, _: {"level": acc}, range(depth), structure)
+    # Wrap bottom-up; each level is one new single-key dict
+    for _ in range(depth):
+        structure = {"level": structure}
+    return structure
 
 
 def create_large_array_structure(size: int = 2000) -> List[int]:
@@ -5,7 +5,6 @@ Test suite for content splitting and processing functionality.
 Tests handling of mixed content files and content type detection.
 """
 
-import shutil
 import tempfile
 from pathlib import Path
 from unittest import TestCase, main
@@ -13,6 +12,11 @@ from unittest import TestCase, main
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
 from warp_content_processor import (
     ContentProcessor,
     ContentSplitter,
@@ -21,6 +25,11 @@ from warp_content_processor import (
 )
 
 
+def _as_yaml(data):
+    """Serialize parametrized test content once, when the module is imported."""
+    return yaml.dump(data, Dumper=_SafeDumper)
+
+
 class TestContentTypeDetector(TestCase):
     """Test the content type detection functionality."""
 
@@ -117,29 +126,33 @@ class TestContentSplitter(TestCase):
         self.assertIn(ContentType.NOTEBOOK, detected_types)
 
 
+@pytest.fixture(scope="module")
+def shared_processor(tmp_path_factory):
+    """Create one processor for tests that validate content without saving it."""
+    return ContentProcessor(tmp_path_factory.mktemp("validation_output"))
+
+
 class TestContentProcessor:
     """Test the content processor functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup_method(self):
+    def setup_method(self, tmp_path):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.output_dir = Path(self.test_dir) / "output"
+        # pytest removes old tmp_path trees in bulk, so no per-test rmtree
+        self.test_dir = tmp_path
+        self.output_dir = tmp_path / "output"
         self.fixtures_dir = Path(__file__).parent / "fixtures"
 
-        # Create processor
-        self.processor = ContentProcessor(self.output_dir)
-
-        yield  # This is where the test runs
-
-        # Cleanup
-        shutil.rmtree(self.test_dir)
+    @pytest.fixture
+    def processor(self, tmp_path):
+        """Create a processor writing into this test's output directory."""
+        return ContentProcessor(tmp_path / "output")
 
     @pytest.mark.timeout(90)
-    def test_mixed_content_processing(self):
+    def test_mixed_content_processing(self, processor):
         """Test processing of mixed content file."""
         # Process the mixed content file
-        results = self.processor.process_file(self.fixtures_dir / "mixed_content.yaml")
+        results = processor.process_file(self.fixtures_dir / "mixed_content.yaml")
 
         # Check that we got results for each content type
         result_types = {r.content_type for r in results}
@@ -162,14 +175,83 @@ class TestContentProcessor:
         type_dir = self.output_dir / content_type.value
         return type_dir.exists() and any(type_dir.iterdir())
 
-    def _prepare_test_content(self, test_content):
-        """Helper method to prepare test content for processing."""
-        # Convert dict content to YAML if needed
-        return (
-            yaml.dump(test_content) if isinstance(test_content, dict) else test_content
+    def test_workflow_document_not_reparsed(self, processor, monkeypatch):
+        """Test that split workflow documents are validated without re-parsing."""
+        workflow_processor = processor.processors[ContentType.WORKFLOW]
+
+        def fail_process(content):
+            raise AssertionError("workflow content was parsed twice")
+
+        monkeypatch.setattr(workflow_processor, "process", fail_process)
+        source = Path(self.test_dir) / "workflow.yaml"
+        source.write_text(
+            yaml.dump(
+                {"name": "Test", "command": "echo test", "shells": ["BASH"]},
+                Dumper=_SafeDumper,
+            ),
+            encoding="utf-8",
+        )
+
+        results = processor.process_file(source)
+
+        assert [r.content_type for r in results] == [ContentType.WORKFLOW]
+        assert results[0].is_valid
+        assert results[0].data["shells"] == ["bash"]
+
+    def test_process_files_parallel(self, processor):
+        """Test batch processing of several files with a worker pool."""
+        files = []
+        for index in range(2):
+            source = Path(self.test_dir) / f"batch_{index}.yaml"
+            source.write_text(
+                yaml.dump(
+                    {
+                        "name": f"Batch {index}",
+                        "command": "echo test",
+                        "shells": ["bash"],
+                    },
+                    Dumper=_SafeDumper,
+                ),
+                encoding="utf-8",
+            )
+            files.append(source)
+        missing_file = Path(self.test_dir) / "missing.yaml"
+        files.append(missing_file)
+
+        outcomes = processor.process_files(files, workers=2)
+
+        assert list(outcomes) == files
+        for path in files[:2]:
+            assert [r.content_type for r in outcomes[path]] == [ContentType.WORKFLOW]
+            assert outcomes[path][0].is_valid
+        assert not outcomes[missing_file][0].is_valid
+        output_files = list(self.output_dir.rglob("*.yaml"))
+        assert len(output_files) == 2
+
+    def test_duplicate_output_names(self, processor):
+        """Test that colliding output names get numbered suffixes."""
+        source = Path(self.test_dir) / "workflow.yaml"
+        source.write_text(
+            yaml.dump(
+                {"name": "Dup", "command": "echo test", "shells": ["bash"]},
+                Dumper=_SafeDumper,
+            ),
+            encoding="utf-8",
         )
+        workflow_dir = self.output_dir / str(ContentType.WORKFLOW)
+        (workflow_dir / "dup.yaml").write_text("existing", encoding="utf-8")
 
-    def test_invalid_content_handling(self):
+        processor.process_file(source)
+        processor.process_file(source)
+
+        assert sorted(p.name for p in workflow_dir.iterdir()) == [
+            "dup.yaml",
+            "dup_1.yaml",
+            "dup_2.yaml",
+        ]
+        assert (workflow_dir / "dup.yaml").read_text(encoding="utf-8") == "existing"
+
+    def test_invalid_content_handling(self, processor):
         """Test handling of invalid content."""
         invalid_content = "Invalid: ]: content"
 
@@ -177,7 +259,7 @@ class TestContentProcessor:
             f.write(invalid_content)
             f.flush()
 
-            results = self.processor.process_file(f.name)
+            results = processor.process_file(f.name)
 
             # Check that we got an error result
             assert all(not r.is_valid for r in results)
@@ -187,11 +269,13 @@ class TestContentProcessor:
     CONTENT_TYPE_PARAMETERS = [
         pytest.param(
             ContentType.WORKFLOW,
-            {"name": "test", "command": "echo test"},
+            _as_yaml({"name": "test", "command": "echo test"}),
             id="workflow",
         ),
         pytest.param(
-            ContentType.PROMPT, {"name": "test", "prompt": "do {{action}}"}, id="prompt"
+            ContentType.PROMPT,
+            _as_yaml({"name": "test", "prompt": "do {{action}}"}),
+            id="prompt",
         ),
         pytest.param(
             ContentType.NOTEBOOK,
@@ -199,36 +283,39 @@ class TestContentProcessor:
             id="notebook",
         ),
         pytest.param(
-            ContentType.ENV_VAR, {"variables": {"TEST": "value"}}, id="env_var"
+            ContentType.ENV_VAR,
+            _as_yaml({"variables": {"TEST": "value"}}),
+            id="env_var",
         ),
         pytest.param(
             ContentType.RULE,
-            {
-                "title": "Test Rule",
-                "description": "A test rule",
-                "guidelines": ["Test guideline"],
-            },
+            _as_yaml(
+                {
+                    "title": "Test Rule",
+                    "description": "A test rule",
+                    "guidelines": ["Test guideline"],
+                }
+            ),
             id="rule",
         ),
     ]
 
     @pytest.mark.parametrize("content_type,test_content", CONTENT_TYPE_PARAMETERS)
     @pytest.mark.timeout(90)
-    def test_content_type_validation(self, content_type, test_content):
+    def test_content_type_validation(
+        self, shared_processor, content_type, test_content
+    ):
         """Test validation of content for each supported content type.
         This parametrized test replaces individual validation test methods
         to avoid conditionals in tests and centralize assertion logic.
         """
         # Skip if no processor is available for this content type
-        if content_type not in self.processor.processors:
+        if content_type not in shared_processor.processors:
             pytest.skip(f"No processor available for {content_type}")
 
-        processor = self.processor.processors[content_type]
-
-        # Convert content using helper to avoid conditionals
-        content = self._prepare_test_content(test_content)
+        processor = shared_processor.processors[content_type]
 
-        result = processor.process(content)
+        result = processor.process(test_content)
 
         # Centralized assertion logic
         assert result.is_valid, f"Validation failed for {content_type}: {result.errors}"
@@ -240,13 +327,13 @@ class TestContentProcessor:
     INVALID_CONTENT_PARAMETERS = [
         pytest.param(
             ContentType.WORKFLOW,
-            {},  # Empty content
+            _as_yaml({}),  # Empty content
             "empty yaml content",
             id="workflow-empty",
         ),
         pytest.param(
             ContentType.PROMPT,
-            {"name": "test"},  # Missing prompt field
+            _as_yaml({"name": "test"}),  # Missing prompt field
             "missing required fields",
             id="prompt-no-prompt",
         ),
@@ -262,26 +349,19 @@ class TestContentProcessor:
     )
     @pytest.mark.timeout(90)
     def test_content_type_validation_errors(
-        self, content_type, invalid_content, expected_error_pattern
+        self, shared_processor, content_type, invalid_content, expected_error_pattern
     ):
         """Test validation error handling for each supported content type.
         This parametrized test demonstrates how to test error scenarios
         without conditionals in tests.
         """
         # Skip if no processor is available for this content type
-        if content_type not in self.processor.processors:
+        if content_type not in shared_processor.processors:
             pytest.skip(f"No processor available for {content_type}")
 
-        processor = self.processor.processors[content_type]
-
-        # Convert dict content to YAML
-        content = (
-            yaml.dump(invalid_content)
-            if isinstance(invalid_content, dict)
-            else invalid_content
-        )
+        processor = shared_processor.processors[content_type]
 
-        result = processor.process(content)
+        result = processor.process(invalid_content)
 
         # Centralized error assertion logic
         assert (
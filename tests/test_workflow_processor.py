@@ -5,10 +5,8 @@ Test suite for the workflow processor.
 Tests validation, processing, and file management functionality.
 """
 
-import shutil
-import tempfile
-from pathlib import Path
 from unittest import TestCase, main
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -75,6 +73,38 @@ class TestWorkflowValidator(TestCase):
         self.assertTrue(result.is_valid)
         self.assertTrue(any("Unknown shell types" in w for w in result.warnings))
 
+    def test_normalized_data_returned(self):
+        """Test that valid results carry normalized data."""
+        workflow = self.valid_workflow.copy()
+        workflow["shells"] = ["BASH", "Zsh"]
+        workflow["tags"] = ["Test", "example"]
+        result = self.validator.process(yaml.dump(workflow))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.data["shells"], ["bash", "zsh"])
+        self.assertEqual(result.data["tags"], ["test", "example"])
+        self.assertEqual(result.data["arguments"][0]["type"], "text")
+
+    def test_validate_does_not_modify_input(self):
+        """Test that validation leaves the caller's data untouched."""
+        workflow = self.valid_workflow.copy()
+        workflow["shells"] = ["BASH"]
+        is_valid, errors, _ = self.validator.validate(workflow)
+        self.assertTrue(is_valid)
+        self.assertEqual(errors, [])
+        self.assertEqual(workflow["shells"], ["BASH"])
+        self.assertNotIn("type", workflow["arguments"][0])
+
+    def test_generate_filename(self):
+        """Test filename generation for ASCII and non-ASCII names."""
+        self.assertEqual(
+            self.validator.generate_filename({"name": "Deploy App-2!"}),
+            "deploy_app_2_.yaml",
+        )
+        self.assertEqual(
+            self.validator.generate_filename({"name": "Café Déjà vu_№1"}),
+            "café_déjà_vu__1.yaml",
+        )
+
     def test_empty_content(self):
         """Test validation of empty content."""
         result = self.validator.process("")
@@ -97,15 +127,18 @@ class TestWorkflowValidator(TestCase):
 class TestWorkflowProcessor(TestCase):
     """Test the workflow processor functionality."""
 
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _temp_dirs(self, tmp_path):
         """Set up temporary directories for testing."""
-        self.test_dir = tempfile.mkdtemp()
-        self.source_dir = Path(self.test_dir) / "source"
-        self.output_dir = Path(self.test_dir) / "output"
+        # tmp_path trees are pruned by pytest itself, sparing an rmtree per test
+        self.test_dir = tmp_path
+        self.source_dir = tmp_path / "source"
+        self.output_dir = tmp_path / "output"
         self.source_dir.mkdir()
         self.output_dir.mkdir()
 
-        # Create test workflows
+    def setUp(self):
+        """Set up test workflows."""
         self.single_workflow = {"name": "Single Test", "command": 'echo "test"'}
 
         self.multiple_workflows = [
@@ -113,10 +146,6 @@ class TestWorkflowProcessor(TestCase):
             {"name": "Second Test", "command": 'echo "second"'},
         ]
 
-    def tearDown(self):
-        """Clean up temporary directories."""
-        shutil.rmtree(self.test_dir)
-
     @pytest.mark.timeout(90)
     def test_single_workflow_processing(self):
         """Test processing of a single workflow file."""
@@ -152,6 +181,35 @@ class TestWorkflowProcessor(TestCase):
         self.assertTrue(any("first_test" in str(file) for file in output_files))
         self.assertTrue(any("second_test" in str(file) for file in output_files))
 
+    def test_multi_document_processing(self):
+        """Test processing of a file with one workflow per YAML document."""
+        workflow_file = self.source_dir / "multi_doc.yaml"
+        workflow_file.write_text(
+            yaml.dump_all(self.multiple_workflows), encoding="utf-8"
+        )
+
+        processor = WorkflowProcessor(self.output_dir)
+        result = processor.process_file(workflow_file)
+
+        self.assertTrue(result)
+        output_names = {f.name for f in self.output_dir.glob("*.yaml")}
+        self.assertEqual(output_names, {"first_test.yaml", "second_test.yaml"})
+
+    def test_large_file_processing(self):
+        """Test that files above the memory-map threshold are parsed."""
+        workflows = [
+            {"name": f"Workflow {index}", "command": f'echo "{index}"'}
+            for index in range(2000)
+        ]
+        workflow_file = self.source_dir / "large.yaml"
+        workflow_file.write_text(yaml.dump(workflows), encoding="utf-8")
+        self.assertGreater(workflow_file.stat().st_size, 64 * 1024)
+
+        results = WorkflowValidator().validate_file(workflow_file)
+
+        self.assertEqual(len(results), 2000)
+        self.assertTrue(all(result.is_valid for result in results))
+
     def test_invalid_workflow_handling(self):
         """Test handling of invalid workflow files."""
         # Create invalid test file
@@ -167,6 +225,70 @@ class TestWorkflowProcessor(TestCase):
         output_files = list(self.output_dir.glob("*.yaml"))
         self.assertEqual(len(output_files), 0)
 
+    def test_invalid_entry_in_workflow_list(self):
+        """Test that an invalid entry does not prevent valid ones being saved."""
+        workflow_file = self.source_dir / "mixed.yaml"
+        workflow_file.write_text(
+            yaml.dump([self.single_workflow, "not a workflow"]), encoding="utf-8"
+        )
+
+        processor = WorkflowProcessor(self.output_dir)
+        result = processor.process_file(workflow_file)
+
+        self.assertFalse(result)
+        self.assertEqual(len(processor.processed_files), 1)
+        self.assertEqual(len(processor.failed_files), 1)
+        self.assertIn("YAML dictionary", processor.failed_files[0][1])
+
+    @pytest.mark.timeout(90)
+    def test_process_files_parallel(self):
+        """Test batch processing of several files with a worker pool."""
+        files = []
+        for index, workflow in enumerate(self.multiple_workflows):
+            workflow_file = self.source_dir / f"batch_{index}.yaml"
+            workflow_file.write_text(yaml.dump(workflow), encoding="utf-8")
+            files.append(workflow_file)
+        missing_file = self.source_dir / "missing.yaml"
+        files.append(missing_file)
+
+        processor = WorkflowProcessor(self.output_dir)
+        outcomes = processor.process_files(files, workers=2)
+
+        self.assertEqual(
+            outcomes, {files[0]: True, files[1]: True, missing_file: False}
+        )
+        self.assertEqual(len(processor.processed_files), 2)
+        self.assertEqual([path for path, _ in processor.failed_files], [missing_file])
+        output_files = list(self.output_dir.glob("*.yaml"))
+        self.assertEqual(len(output_files), 2)
+
+    def test_process_files_serial_read_ahead(self):
+        """Test in-process batch processing with read-ahead of upcoming files."""
+        files = []
+        for index, workflow in enumerate(self.multiple_workflows):
+            workflow_file = self.source_dir / f"serial_{index}.yaml"
+            workflow_file.write_text(yaml.dump(workflow), encoding="utf-8")
+            files.append(workflow_file)
+        large_file = self.source_dir / "large.yaml"
+        large_file.write_text(
+            yaml.dump(
+                {"name": "Large", "command": "echo large", "description": "x" * 70000}
+            ),
+            encoding="utf-8",
+        )
+        files.append(large_file)
+        missing_file = self.source_dir / "missing.yaml"
+        files.append(missing_file)
+
+        processor = WorkflowProcessor(self.output_dir)
+        outcomes = processor.process_files(files, workers=1)
+
+        self.assertEqual(list(outcomes), files)
+        self.assertEqual(list(outcomes.values()), [True, True, True, False])
+        self.assertEqual([path for path, _ in processor.failed_files], [missing_file])
+        output_files = list(self.output_dir.glob("*.yaml"))
+        self.assertEqual(len(output_files), 3)
+
     @pytest.mark.timeout(90)
     def test_duplicate_name_handling(self):
         """Test handling of workflows with duplicate names."""
@@ -193,6 +315,190 @@ class TestWorkflowProcessor(TestCase):
         self.assertEqual(len(files), 2)
         self._verify_files_have_different_names(files)
 
+    def test_existing_output_not_overwritten(self):
+        """Test that files already in the output directory are preserved."""
+        existing = self.output_dir / "single_test.yaml"
+        existing.write_text("name: existing\n", encoding="utf-8")
+        workflow_file = self.source_dir / "single.yaml"
+        workflow_file.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+
+        processor = WorkflowProcessor(self.output_dir)
+        self.assertTrue(processor.process_file(workflow_file))
+
+        self.assertEqual(existing.read_text(encoding="utf-8"), "name: existing\n")
+        self.assertEqual(
+            processor.processed_files[0][1], self.output_dir / "single_test_1.yaml"
+        )
+
+    def test_output_written_atomically(self):
+        """Test that output is complete and no temporary files are left behind."""
+        workflow_file = self.source_dir / "single.yaml"
+        workflow_file.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+
+        processor = WorkflowProcessor(self.output_dir)
+        self.assertTrue(processor.process_file(workflow_file))
+
+        self.assertEqual(
+            [f.name for f in self.output_dir.iterdir()], ["single_test.yaml"]
+        )
+        output = (self.output_dir / "single_test.yaml").read_text(encoding="utf-8")
+        self.assertEqual(yaml.safe_load(output), self.single_workflow)
+
+    def test_batch_durability_syncs_once(self):
+        """Test that batch durability defers each file's fsync to one flush."""
+        files = []
+        for index, workflow in enumerate(self.multiple_workflows):
+            workflow_file = self.source_dir / f"durable_{index}.yaml"
+            workflow_file.write_text(yaml.dump(workflow), encoding="utf-8")
+            files.append(workflow_file)
+
+        processor = WorkflowProcessor(self.output_dir, durability="batch")
+        with patch("os.fsync") as fsync, patch("os.sync") as sync:
+            outcomes = processor.process_files(files, workers=1)
+            self.assertEqual(fsync.call_count, 3)  # both files, then the directory
+            processor.sync_output()
+
+        self.assertEqual(list(outcomes.values()), [True, True])
+        self.assertEqual(fsync.call_count, 3)  # nothing left to flush
+        sync.assert_not_called()
+        self.assertEqual(len(list(self.output_dir.glob("*.yaml"))), 2)
+
+    def test_empty_and_oversized_files_skipped(self):
+        """Test that empty and oversized files are refused without parsing."""
+        empty_file = self.source_dir / "empty.yaml"
+        empty_file.write_bytes(b"")
+        large_file = self.source_dir / "large.yaml"
+        large_file.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+        small_file = self.source_dir / "small.yaml"
+        small_file.write_text("name: A\ncommand: a\n", encoding="utf-8")
+        files = [empty_file, large_file, small_file]
+
+        limit = small_file.stat().st_size
+        for workers in (1, 2):
+            processor = WorkflowProcessor(self.output_dir, max_file_size=limit)
+            outcomes = processor.process_files(files, workers=workers)
+
+            self.assertEqual(list(outcomes.values()), [False, False, True])
+            errors = dict(processor.failed_files)
+            self.assertEqual(errors[empty_file], "No valid workflows found")
+            self.assertIn("exceeds limit", errors[large_file])
+
+    def test_skip_duplicate_inputs(self):
+        """Test that byte-identical input files are only processed once."""
+        content = yaml.dump(self.single_workflow)
+        files = []
+        for name in ("first.yaml", "copy.yaml"):
+            workflow_file = self.source_dir / name
+            workflow_file.write_text(content, encoding="utf-8")
+            files.append(workflow_file)
+
+        processor = WorkflowProcessor(self.output_dir)
+        outcomes = processor.process_files(files, workers=1, skip_duplicate_inputs=True)
+
+        self.assertEqual(outcomes, {files[0]: True, files[1]: True})
+        self.assertEqual(len(processor.processed_files), 1)
+        self.assertEqual(len(list(self.output_dir.glob("*.yaml"))), 1)
+
+    def test_dir_and_none_durability(self):
+        """Test fsync counts for the directory-only and no-fsync modes."""
+        workflow_file = self.source_dir / "single.yaml"
+        workflow_file.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+
+        for durability, expected_fsyncs in (("dir", 1), ("none", 0)):
+            processor = WorkflowProcessor(
+                self.output_dir / durability, durability=durability
+            )
+            with patch("os.fsync") as fsync, patch("os.sync") as sync:
+                processor.process_files([workflow_file])
+
+            self.assertEqual(fsync.call_count, expected_fsyncs)
+            sync.assert_not_called()
+
+    def test_unknown_durability_mode(self):
+        """Test that an unknown durability mode is rejected."""
+        with self.assertRaises(ValueError):
+            WorkflowProcessor(self.output_dir, durability="sometimes")
+
+    def test_process_files_bundle_output(self):
+        """Test that bundle mode writes every workflow to a single file."""
+        workflow_file = self.source_dir / "multiple.yaml"
+        workflow_file.write_text(yaml.dump(self.multiple_workflows), encoding="utf-8")
+
+        processor = WorkflowProcessor(self.output_dir)
+        outcomes = processor.process_files([workflow_file], bundle_output=True)
+
+        self.assertEqual(outcomes, {workflow_file: True})
+        bundle = self.output_dir / "workflows_bundle.yaml"
+        self.assertEqual([f.name for f in self.output_dir.iterdir()], [bundle.name])
+        with bundle.open(encoding="utf-8") as handle:
+            documents = list(yaml.safe_load_all(handle))
+        self.assertEqual(documents, self.multiple_workflows)
+        self.assertEqual(
+            processor.processed_files,
+            [(workflow_file, bundle), (workflow_file, bundle)],
+        )
+
+    def test_output_write_failure_recorded(self):
+        """Test that a failed output write marks its files as failed."""
+        workflow_file = self.source_dir / "multiple.yaml"
+        workflow_file.write_text(yaml.dump(self.multiple_workflows), encoding="utf-8")
+
+        for bundle_output in (False, True):
+            processor = WorkflowProcessor(self.output_dir / str(bundle_output))
+            with patch.object(
+                WorkflowProcessor, "_atomic_write", side_effect=OSError("disk full")
+            ):
+                outcomes = processor.process_files(
+                    [workflow_file], bundle_output=bundle_output
+                )
+
+            self.assertEqual(outcomes, {workflow_file: False})
+            self.assertEqual(processor.failed_files, [(workflow_file, "disk full")])
+            self.assertEqual(processor.processed_files, [])
+
+    def test_write_all_beyond_iov_limit(self):
+        """Test that batched writes handle more buffers than one writev call."""
+        buffers = [str(index).encode() for index in range(2500)]
+        target = self.output_dir / "buffers.bin"
+
+        WorkflowProcessor._atomic_write(target, *buffers)
+
+        self.assertEqual(target.read_bytes(), b"".join(buffers))
+
+    def test_dedupe_output_skips_identical_workflows(self):
+        """Test that identical workflows are written once when deduplicating."""
+        file1 = self.source_dir / "first.yaml"
+        file2 = self.source_dir / "second.yaml"
+        file1.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+        file2.write_text(yaml.dump(self.single_workflow), encoding="utf-8")
+
+        processor = WorkflowProcessor(self.output_dir, dedupe_output=True)
+        self.assertTrue(processor.process_file(file1))
+        self.assertTrue(processor.process_file(file2))
+
+        output_path = self.output_dir / "single_test.yaml"
+        self.assertEqual(list(self.output_dir.glob("*.yaml")), [output_path])
+        self.assertEqual(
+            processor.processed_files, [(file1, output_path), (file2, output_path)]
+        )
+
+    def test_trust_input_skips_validation(self):
+        """Test that trusted input is normalized and saved without validation."""
+        workflow_file = self.source_dir / "trusted.yaml"
+        workflow_file.write_text(
+            yaml.dump({"name": "Trusted", "shells": ["BASH"], "extra": 1}),
+            encoding="utf-8",
+        )
+
+        processor = WorkflowProcessor(self.output_dir, trust_input=True)
+        self.assertTrue(processor.process_file(workflow_file))
+
+        self.assertEqual(processor.warnings, [])
+        output = yaml.safe_load(
+            (self.output_dir / "trusted.yaml").read_text(encoding="utf-8")
+        )
+        self.assertEqual(output, {"name": "Trusted", "shells": ["bash"], "extra": 1})
+
     def _verify_files_have_different_names(self, files):
         """Helper to verify that files have different names."""
         # Use set to check uniqueness instead of conditional
@@ -5,12 +5,18 @@ This module provides utilities for loading fixtures and creating
 dynamic test data for different test scenarios.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 # Fixture file paths
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
@@ -23,8 +29,8 @@ def load_fixture_data(filename: str) -> Any:
         raise FileNotFoundError(f"Fixture file not found: {file_path}")
 
     if file_path.suffix in [".yaml", ".yml"]:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            return yaml.load(f, Loader=_SafeLoader)
     elif file_path.suffix == ".json":
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -335,11 +341,18 @@ def get_performance_test_data() -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _default_workflow_yaml() -> str:
+    """Dump the default sample workflow once; it never changes."""
+    return yaml.dump(get_sample_workflows()[0], default_flow_style=False)
+
+
 def generate_test_file_content(content_type: str, **kwargs) -> str:
     """Generate test file content based on type."""
     if content_type == "workflow":
-        workflow = kwargs.get("workflow", get_sample_workflows()[0])
-        return yaml.dump(workflow, default_flow_style=False)
+        if "workflow" not in kwargs:
+            return _default_workflow_yaml()
+        return yaml.dump(kwargs["workflow"], default_flow_style=False)
 
     elif content_type == "notebook":
         notebook = kwargs.get("notebook", get_sample_notebooks()[0])
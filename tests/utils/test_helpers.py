@@ -13,6 +13,11 @@ from unittest.mock import Mock, patch
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def create_temp_file(content: str, suffix: str = ".txt") -> Generator[Path, None, None]:
     """Create a temporary file with the given content."""
@@ -50,8 +55,8 @@ def load_test_data(filename: str) -> Any:
         raise FileNotFoundError(f"Test data file not found: {file_path}")
 
     if file_path.suffix in [".yaml", ".yml"]:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            return yaml.load(f, Loader=_SafeLoader)
     elif file_path.suffix == ".json":
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -196,8 +201,8 @@ class TestDataLoader:
     def load_yaml(self, filename: str) -> Any:
         """Load YAML test data."""
         file_path = self.fixtures_dir / filename
-        with open(file_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        with open(file_path, "rb") as f:
+            return yaml.load(f, Loader=_SafeLoader)
 
     def load_json(self, filename: str) -> Any:
         """Load JSON test data."""
@@ -90,6 +90,15 @@ class TestValidatePlaceholders:
         assert len(result.warnings) > 0
         assert any("not dictionaries" in w for w in result.warnings)
 
+    def test_custom_pattern_without_group(self):
+        """Test that a pattern without a capturing group still strips braces."""
+        content = "echo {{name}} {{other}}"
+        arguments = [{"name": "name"}, {"name": "other"}]
+        for pattern in (r"{{[a-z]+}}", r"{{([a-z]+)}}"):
+            result = validate_placeholders(content, arguments, pattern=pattern)
+            assert result.is_valid
+            assert result.warnings == []
+
 
 class TestValidateTags:
     """Test tag validation."""
@@ -126,3 +135,13 @@ class TestValidateTags:
         assert any("invalid characters" in w for w in warnings)
         assert any("ends with a hyphen" in w for w in warnings)
         assert any("is not a string" in w for w in warnings)
+
+    def test_batch_fast_path_matches_per_tag_checks(self):
+        """Test that the batched valid-tag scan agrees with per-tag checks."""
+        assert validate_tags(["python", "v2", "a1-b2"]).warnings == []
+        # A newline inside a tag must not let it pass as two valid tags
+        result = validate_tags(["python", "in\nvalid"])
+        assert any("invalid characters" in w for w in result.warnings)
+        # A custom pattern bypasses the default-pattern fast path
+        result = validate_tags(["python"], pattern=r"^[a-z]{1,3}$")
+        assert len(result.warnings) == 1